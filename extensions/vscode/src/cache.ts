@@ -9,24 +9,22 @@ export interface CacheEntry<T> {
 }
 
 /**
- * Generic cache implementation with TTL support and automatic cleanup
+ * Generic LRU cache with TTL support. Expired entries are dropped lazily on
+ * access and the entry count is capped, so no timers are needed.
  */
 export class Cache<T> {
   private readonly store = new Map<string, CacheEntry<T>>();
   private readonly defaultTtlMs: number;
-  private cleanupTimer?: ReturnType<typeof setInterval>;
+  private readonly maxEntries: number;
 
   /**
    * Creates a new cache instance
    * @param defaultTtlMs Default time-to-live in milliseconds
+   * @param maxEntries Maximum number of entries before the least recently used is evicted
    */
-  constructor(defaultTtlMs: number = 300000) { // Default 5 minutes
+  constructor(defaultTtlMs: number = 300000, maxEntries: number = 100) { // Default 5 minutes
     this.defaultTtlMs = defaultTtlMs;
-
-    // Schedule periodic cleanup every minute
-    this.cleanupTimer = setInterval(() => {
-      this.cleanup();
-    }, 60000);
+    this.maxEntries = maxEntries;
   }
 
   /**
@@ -41,13 +39,13 @@ export class Cache<T> {
       return undefined;
     }
 
-    const now = Date.now();
-    if (entry.expiresAt <= now) {
-      // Entry expired, remove it
-      this.store.delete(key);
+    // Always delete: expired entries are dropped, live ones re-inserted as most recent
+    this.store.delete(key);
+    if (entry.expiresAt <= Date.now()) {
       return undefined;
     }
 
+    this.store.set(key, entry);
     return entry.value;
   }
 
@@ -61,7 +59,16 @@ export class Cache<T> {
     const ttl = ttlMs ?? this.defaultTtlMs;
     const expiresAt = Date.now() + ttl;
 
+    this.store.delete(key);
     this.store.set(key, { value, expiresAt });
+
+    while (this.store.size > this.maxEntries) {
+      const oldest = this.store.keys().next().value;
+      if (oldest === undefined) {
+        break;
+      }
+      this.store.delete(oldest);
+    }
   }
 
   /**
@@ -88,36 +95,9 @@ export class Cache<T> {
   }
 
   /**
-   * Disposes the cache and clears the cleanup timer
+   * Disposes the cache
    */
   dispose(): void {
-    if (this.cleanupTimer) {
-      clearInterval(this.cleanupTimer);
-      this.cleanupTimer = undefined;
-    }
     this.clear();
   }
-
-  /**
-   * Removes expired entries from the cache (private cleanup method)
-   */
-  private cleanup(): void {
-    const now = Date.now();
-    const keysToDelete: string[] = [];
-
-    // Collect expired keys
-    for (const [key, entry] of this.store.entries()) {
-      if (entry.expiresAt <= now) {
-        keysToDelete.push(key);
-      }
-    }
-
-    // Remove expired entries
-    keysToDelete.forEach(key => this.store.delete(key));
-
-    // Log cleanup activity if significant
-    if (keysToDelete.length > 0) {
-      console.log(`ContextCore Cache: Cleaned up ${keysToDelete.length} expired entries`);
-    }
-  }
 }
@@ -1,10 +1,11 @@
 import * as vscode from 'vscode';
 import * as logger from './logger';
-import { ContextProvider } from './providers';
+import { ContextProvider, setConfigSidecarDir } from './providers';
 import { ContextMapper } from './mapping';
 import { ContextStatusBar } from './ui/statusBar';
 import { ProjectTreeProvider } from './ui/sidePanel';
 import { DecorationProvider } from './ui/decorations';
+import { disposeYamlWorkers } from './workers';
 import {
   createRefreshCommand,
   createShowImpactCommand,
@@ -22,6 +23,9 @@ export async function activate(context: vscode.ExtensionContext): Promise<void>
     logger.initialize();
     logger.info('ContextCore extension activating...');
 
+    // Parsed YAML configs are cached as JSON in global storage across sessions
+    setConfigSidecarDir(context.globalStorageUri);
+
     // Create and initialize ContextProvider
     const contextProvider = new ContextProvider();
     await contextProvider.initialize();
@@ -94,5 +98,6 @@ export async function activate(context: vscode.ExtensionContext): Promise<void>
  */
 export function deactivate(): void {
   logger.info('ContextCore extension deactivated');
+  disposeYamlWorkers();
   logger.dispose();
 }
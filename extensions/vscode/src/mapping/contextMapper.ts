@@ -2,8 +2,8 @@ import * as vscode from 'vscode';
 import * as path from 'path';
 import { ProjectContext, Risk } from '../types';
 import { ContextProvider } from '../providers';
-import { matchesPattern } from './patternMatcher';
-import { findContextFiles } from './workspaceScanner';
+import { compilePattern, normalizePath, PathMatcher } from './patternMatcher';
+import { findContextFiles, resetContextFilePatterns } from './workspaceScanner';
 
 /**
  * Flattened context for UI display
@@ -19,6 +19,11 @@ interface FlattenedContext {
   };
 }
 
+/**
+ * Soft cap on memoized file-to-context lookups
+ */
+const FILE_CONTEXT_CACHE_MAX_ENTRIES = 2048;
+
 /**
  * Project info for commands
  */
@@ -35,6 +40,7 @@ export class ContextMapper implements vscode.Disposable {
   private contextProvider: ContextProvider;
   private fileToContextCache: Map<string, ProjectContext | undefined>;
   private contextFilesCache: Map<string, vscode.Uri[]>;
+  private scopeMatchers: WeakMap<ProjectContext, PathMatcher[]>;
   private disposables: vscode.Disposable[];
   private isInitialized: boolean;
 
@@ -42,6 +48,7 @@ export class ContextMapper implements vscode.Disposable {
     this.contextProvider = contextProvider;
     this.fileToContextCache = new Map();
     this.contextFilesCache = new Map();
+    this.scopeMatchers = new WeakMap();
     this.disposables = [];
     this.isInitialized = false;
   }
@@ -58,6 +65,7 @@ export class ContextMapper implements vscode.Disposable {
         this.contextFilesCache.set(folder.uri.toString(), contextFiles);
       }
 
+      this.compileScopeMatchers();
       this.setupWorkspaceChangeListener();
       this.isInitialized = true;
     } catch (error) {
@@ -79,11 +87,20 @@ export class ContextMapper implements vscode.Disposable {
     const cacheKey = uri.fsPath;
     if (this.fileToContextCache.has(cacheKey)) {
       const context = this.fileToContextCache.get(cacheKey);
+      // Re-insert so Map order tracks recency for eviction
+      this.fileToContextCache.delete(cacheKey);
+      this.fileToContextCache.set(cacheKey, context);
       return context ? this.flattenContext(context) : undefined;
     }
 
     const context = this.findContextForFile(uri);
     this.fileToContextCache.set(cacheKey, context);
+    if (this.fileToContextCache.size > FILE_CONTEXT_CACHE_MAX_ENTRIES) {
+      const oldest = this.fileToContextCache.keys().next().value;
+      if (oldest !== undefined) {
+        this.fileToContextCache.delete(oldest);
+      }
+    }
     return context ? this.flattenContext(context) : undefined;
   }
 
@@ -171,20 +188,40 @@ export class ContextMapper implements vscode.Disposable {
 
   private findRiskScopeContext(uri: vscode.Uri): ProjectContext | undefined {
     const contexts = this.contextProvider.getAllContexts();
-    const relativePath = this.getRelativePath(uri);
+    const relativePath = normalizePath(this.getRelativePath(uri));
 
     for (const context of contexts) {
-      if (context.risk?.scope) {
-        for (const pattern of context.risk.scope) {
-          if (matchesPattern(relativePath, pattern)) {
-            return context;
-          }
+      for (const matcher of this.getScopeMatchers(context)) {
+        if (matcher(relativePath)) {
+          return context;
         }
       }
     }
     return undefined;
   }
 
+  /**
+   * Compiled risk.scope matchers for a context, built on first use.
+   * Keyed by context identity, so reloaded contexts are recompiled.
+   */
+  private getScopeMatchers(context: ProjectContext): PathMatcher[] {
+    let matchers = this.scopeMatchers.get(context);
+    if (!matchers) {
+      matchers = (context.risk?.scope ?? []).map(compilePattern);
+      this.scopeMatchers.set(context, matchers);
+    }
+    return matchers;
+  }
+
+  /**
+   * Precompile scope matchers for every currently loaded context
+   */
+  private compileScopeMatchers(): void {
+    for (const context of this.contextProvider.getAllContexts()) {
+      this.getScopeMatchers(context);
+    }
+  }
+
   private findParentDirectoryContext(uri: vscode.Uri): ProjectContext | undefined {
     let currentDir = path.dirname(uri.fsPath);
     const workspaceRoot = this.getWorkspaceRoot(uri);
@@ -227,23 +264,32 @@ export class ContextMapper implements vscode.Disposable {
    * Set up file system watchers for context files
    */
   private setupWorkspaceChangeListener(): void {
-    const patterns = [
-      '**/.contextcore',
-      '**/.contextcore.yaml',
-      '**/.contextcore.yml',
-      '**/projectcontext.yaml',
-      '**/projectcontext.yml'
-    ];
-
-    for (const pattern of patterns) {
-      const watcher = vscode.workspace.createFileSystemWatcher(pattern);
-
-      watcher.onDidCreate((uri) => this.handleContextFileChange(uri));
-      watcher.onDidChange((uri) => this.handleContextFileChange(uri));
-      watcher.onDidDelete((uri) => this.handleContextFileChange(uri));
-
-      this.disposables.push(watcher);
-    }
+    // One watcher for every context file name instead of one per name
+    const watcher = vscode.workspace.createFileSystemWatcher(
+      '**/{.contextcore,.contextcore.yaml,.contextcore.yml,projectcontext.yaml,projectcontext.yml}'
+    );
+
+    watcher.onDidCreate((uri) => this.handleContextFileChange(uri));
+    watcher.onDidChange((uri) => this.handleContextFileChange(uri));
+    watcher.onDidDelete((uri) => this.handleContextFileChange(uri));
+
+    this.disposables.push(watcher);
+
+    // Reloaded contexts invalidate memoized lookups and compiled scopes
+    this.disposables.push(
+      this.contextProvider.onContextChange(() => {
+        this.fileToContextCache.clear();
+        this.compileScopeMatchers();
+      })
+    );
+
+    // Folder roots decide relative paths and root contexts
+    this.disposables.push(
+      vscode.workspace.onDidChangeWorkspaceFolders(() => {
+        this.fileToContextCache.clear();
+        resetContextFilePatterns();
+      })
+    );
 
     // Listen for file changes to invalidate cache
     const fileWatcher = vscode.workspace.onDidChangeTextDocument((event) => {
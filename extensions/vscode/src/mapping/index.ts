@@ -1,4 +1,4 @@
 export { ContextMapper } from './contextMapper';
-export { matchesPattern, matchesAnyPattern } from './patternMatcher';
-export { findContextFiles } from './workspaceScanner';
+export { matchesPattern, matchesAnyPattern, compilePattern, normalizePath, PathMatcher } from './patternMatcher';
+export { findContextFiles, resetContextFilePatterns } from './workspaceScanner';
 export type { Risk } from '../types';
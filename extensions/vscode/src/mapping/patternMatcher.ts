@@ -1,11 +1,17 @@
 /**
- * Check if a file path matches a given pattern
+ * Precompiled path test. Expects a path already normalized to '/' separators.
+ */
+export type PathMatcher = (normalizedPath: string) => boolean;
+
+const BACKSLASH = /\\/;
+const BACKSLASHES = /\\/g;
+
+/**
+ * Compile a glob pattern once into a reusable matcher
  * Supports glob patterns: *, **, ?, and negation with !
  */
-export function matchesPattern(filePath: string, pattern: string): boolean {
-  // Normalize path separators
-  const normalizedPath = filePath.replace(/\\/g, '/');
-  let normalizedPattern = pattern.replace(/\\/g, '/');
+export function compilePattern(pattern: string): PathMatcher {
+  let normalizedPattern = normalizePath(pattern);
 
   // Handle negation
   const isNegated = normalizedPattern.startsWith('!');
@@ -15,9 +21,26 @@ export function matchesPattern(filePath: string, pattern: string): boolean {
 
   // Convert glob pattern to regex
   const regex = globToRegex(normalizedPattern);
-  const matches = regex.test(normalizedPath);
 
-  return isNegated ? !matches : matches;
+  return isNegated
+    ? (normalizedPath: string) => !regex.test(normalizedPath)
+    : (normalizedPath: string) => regex.test(normalizedPath);
+}
+
+/**
+ * Normalize path separators to '/' for use with a PathMatcher.
+ * POSIX paths have no backslashes and are returned without copying.
+ */
+export function normalizePath(filePath: string): string {
+  return BACKSLASH.test(filePath) ? filePath.replace(BACKSLASHES, '/') : filePath;
+}
+
+/**
+ * Check if a file path matches a given pattern
+ * Supports glob patterns: *, **, ?, and negation with !
+ */
+export function matchesPattern(filePath: string, pattern: string): boolean {
+  return compilePattern(pattern)(normalizePath(filePath));
 }
 
 /**
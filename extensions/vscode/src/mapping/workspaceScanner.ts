@@ -1,29 +1,75 @@
 import * as vscode from 'vscode';
 
+/**
+ * Context file names recognised by the scanner
+ */
+const CONTEXT_FILE_NAMES = [
+  '.contextcore',
+  '.contextcore.yaml',
+  '.contextcore.yml',
+  'projectcontext.yaml',
+  'projectcontext.yml'
+];
+
+/**
+ * Directory prefixes searched below the workspace root (depth 0-3).
+ * Only shallow `*` segments are used so the search never recurses with `**`.
+ */
+const SCAN_DEPTH_PREFIXES = ['', '*/', '*/*/', '*/*/*/'];
+
+/**
+ * Single include glob covering every context file name at every scanned depth
+ */
+const CONTEXT_FILES_GLOB = `{${SCAN_DEPTH_PREFIXES
+  .flatMap(prefix => CONTEXT_FILE_NAMES.map(name => `${prefix}${name}`))
+  .join(',')}}`;
+
+/**
+ * Directories never searched for context files
+ */
+const SCAN_EXCLUDE_GLOB = '{**/node_modules,**/.git,**/out,**/dist,**/.venv,**/target,**/build}/**';
+
+/**
+ * Upper bound on matches returned by one scan
+ */
+const SCAN_MAX_RESULTS = 256;
+
+/**
+ * Include pattern per workspace folder, built once and reused across scans
+ */
+let folderPatterns: WeakMap<vscode.WorkspaceFolder, vscode.RelativePattern> = new WeakMap();
+
+function getFolderPattern(folder: vscode.WorkspaceFolder): vscode.RelativePattern {
+  let pattern = folderPatterns.get(folder);
+  if (!pattern) {
+    pattern = new vscode.RelativePattern(folder, CONTEXT_FILES_GLOB);
+    folderPatterns.set(folder, pattern);
+  }
+  return pattern;
+}
+
+/**
+ * Forget cached folder patterns (call when workspace folders change)
+ */
+export function resetContextFilePatterns(): void {
+  folderPatterns = new WeakMap();
+}
+
 /**
  * Find all context files in a workspace folder
  * Returns files sorted by depth (closer to root first)
  */
-export async function findContextFiles(folder: vscode.WorkspaceFolder): Promise<vscode.Uri[]> {
+export async function findContextFiles(
+  folder: vscode.WorkspaceFolder,
+  token?: vscode.CancellationToken
+): Promise<vscode.Uri[]> {
   try {
-    const patterns = [
-      '.contextcore',
-      '.contextcore.yaml',
-      '.contextcore.yml',
-      'projectcontext.yaml',
-      'projectcontext.yml'
-    ];
-
-    const allFiles: vscode.Uri[] = [];
-
-    for (const pattern of patterns) {
-      const globPattern = new vscode.RelativePattern(folder, `**/${pattern}`);
-      const files = await vscode.workspace.findFiles(
-        globPattern,
-        '**/node_modules/**'
-      );
-      allFiles.push(...files);
-    }
+    const allFiles = await vscode.workspace.findFiles(
+      getFolderPattern(folder),
+      SCAN_EXCLUDE_GLOB,
+      SCAN_MAX_RESULTS,
+      token
+    );
 
     // Remove duplicates and sort by depth (closer to root first)
     const uniqueFiles = Array.from(new Set(allFiles.map(f => f.toString())))
@@ -4,25 +4,36 @@ import { ProjectContext } from '../types';
 
 /**
  * Load project context from ContextCore CLI.
- * Executes 'contextcore context show --format json' command.
+ * Spawns 'contextcore context show --format json' directly (no shell).
  */
-export async function loadFromCli(workspaceFolder: vscode.WorkspaceFolder): Promise<ProjectContext | undefined> {
+export async function loadFromCli(
+    workspaceFolder: vscode.WorkspaceFolder,
+    signal?: AbortSignal
+): Promise<ProjectContext | undefined> {
     return new Promise<ProjectContext | undefined>((resolve) => {
-        const command = 'contextcore context show --format json';
-        const options = {
+        const options: child_process.SpawnOptions = {
             cwd: workspaceFolder.uri.fsPath,
-            timeout: 10000 // 10 second timeout
+            timeout: 10000, // 10 second timeout
+            signal, // Kills the process if another source answers first
+            stdio: ['ignore', 'pipe', 'ignore']
         };
 
-        child_process.exec(command, options, (error, stdout) => {
-            if (error) {
-                // Command failed - return undefined without throwing
+        const chunks: Buffer[] = [];
+        const child = child_process.spawn('contextcore', ['context', 'show', '--format', 'json'], options);
+
+        child.stdout?.on('data', (chunk: Buffer) => chunks.push(chunk));
+
+        // Spawn failure (e.g. CLI not installed) or abort - return undefined without throwing
+        child.on('error', () => resolve(undefined));
+
+        child.on('close', (code) => {
+            if (code !== 0) {
                 resolve(undefined);
                 return;
             }
 
             try {
-                const context = JSON.parse(stdout) as ProjectContext;
+                const context = JSON.parse(Buffer.concat(chunks).toString('utf8')) as ProjectContext;
                 resolve(context);
             } catch {
                 // JSON parsing failed - return undefined
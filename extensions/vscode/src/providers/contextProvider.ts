@@ -1,10 +1,20 @@
 import * as vscode from 'vscode';
 import { ProjectContext } from '../types';
 import { Cache } from '../cache';
-import { loadLocalConfig } from './localConfigProvider';
+import { clearLocalConfigCache, loadLocalConfig } from './localConfigProvider';
 import { loadFromCli } from './cliProvider';
-import { loadFromKubernetes } from './kubernetesProvider';
-import { getFullConfig } from '../config';
+import { loadFromKubernetes, resetKubernetesClient } from './kubernetesProvider';
+import { getFullConfig, onConfigChange } from '../config';
+
+/**
+ * How long a local config load may take before a faster remote source wins
+ */
+const LOCAL_SOURCE_GRACE_MS = 50;
+
+/**
+ * Every context file name, as one glob so each folder needs a single watcher
+ */
+const CONTEXT_FILES_WATCH_GLOB = '**/{.contextcore,.contextcore.yaml,.contextcore.yml,projectcontext.yaml,projectcontext.yml}';
 
 /**
  * Provider that loads ProjectContext from multiple sources with caching and automatic refresh.
@@ -17,11 +27,24 @@ export class ContextProvider implements vscode.Disposable {
     private allContexts: ProjectContext[] = [];
     private refreshTimer?: ReturnType<typeof setInterval>;
     private disposables: vscode.Disposable[] = [];
+    private folderWatchers: Map<string, vscode.Disposable> = new Map();
 
     constructor() {
         const config = getFullConfig();
         this.cache = new Cache<ProjectContext>(config.refreshInterval);
         this.disposables.push(this._onContextChange);
+        this.disposables.push(onConfigChange(resetKubernetesClient));
+
+        for (const folder of vscode.workspace.workspaceFolders || []) {
+            this.watchFolder(folder);
+        }
+        this.disposables.push(
+            vscode.workspace.onDidChangeWorkspaceFolders(event => {
+                clearLocalConfigCache();
+                event.removed.forEach(folder => this.unwatchFolder(folder));
+                event.added.forEach(folder => this.watchFolder(folder));
+            })
+        );
     }
 
     /**
@@ -118,28 +141,63 @@ export class ContextProvider implements vscode.Disposable {
     }
 
     /**
-     * Load context from sources in priority order: local -> CLI -> Kubernetes.
+     * Load context from all sources concurrently. Local config wins if it
+     * answers within LOCAL_SOURCE_GRACE_MS; otherwise the first source to
+     * produce a context wins. Losing sources are aborted.
      */
     private async loadFromSources(workspaceFolder: vscode.WorkspaceFolder): Promise<ProjectContext | undefined> {
-        // Try local config first
-        const localContext = await loadLocalConfig(workspaceFolder);
-        if (localContext) {
-            return localContext;
-        }
+        const controller = new AbortController();
+        const swallow = (): undefined => undefined;
+
+        const local = loadLocalConfig(workspaceFolder).catch(swallow);
+        const cli = loadFromCli(workspaceFolder, controller.signal).catch(swallow);
+        const kubernetes = loadFromKubernetes(workspaceFolder.name, undefined, controller.signal).catch(swallow);
+
+        try {
+            let graceTimer: ReturnType<typeof setTimeout> | undefined;
+            const grace = new Promise<undefined>(resolve => {
+                graceTimer = setTimeout(() => resolve(undefined), LOCAL_SOURCE_GRACE_MS);
+            });
+            const localContext = await Promise.race([local, grace]);
+            clearTimeout(graceTimer);
+            if (localContext) {
+                return localContext;
+            }
 
-        // Try CLI second
-        const cliContext = await loadFromCli(workspaceFolder);
-        if (cliContext) {
-            return cliContext;
+            return await firstDefined([local, cli, kubernetes]);
+        } finally {
+            controller.abort();
         }
+    }
 
-        // Try Kubernetes last
-        const kubernetesContext = await loadFromKubernetes(workspaceFolder.name);
-        if (kubernetesContext) {
-            return kubernetesContext;
+    /**
+     * Watch one workspace folder's context files; edits only invalidate
+     * that folder's cached context.
+     */
+    private watchFolder(folder: vscode.WorkspaceFolder): void {
+        const key = folder.uri.toString();
+        if (this.folderWatchers.has(key)) {
+            return;
         }
 
-        return undefined;
+        const watcher = vscode.workspace.createFileSystemWatcher(
+            new vscode.RelativePattern(folder, CONTEXT_FILES_WATCH_GLOB)
+        );
+        const invalidate = () => this.cache.invalidate(key);
+        const subscriptions = [
+            watcher,
+            watcher.onDidCreate(invalidate),
+            watcher.onDidChange(invalidate),
+            watcher.onDidDelete(invalidate)
+        ];
+        this.folderWatchers.set(key, vscode.Disposable.from(...subscriptions));
+    }
+
+    private unwatchFolder(folder: vscode.WorkspaceFolder): void {
+        const key = folder.uri.toString();
+        this.folderWatchers.get(key)?.dispose();
+        this.folderWatchers.delete(key);
+        this.cache.invalidate(key);
     }
 
     /**
@@ -169,5 +227,27 @@ export class ContextProvider implements vscode.Disposable {
         });
 
         this.disposables = [];
+
+        this.folderWatchers.forEach(watcher => watcher.dispose());
+        this.folderWatchers.clear();
     }
 }
+
+/**
+ * Resolve with the first promise to yield a defined value, or undefined once
+ * all have settled without one.
+ */
+function firstDefined<T>(promises: Promise<T | undefined>[]): Promise<T | undefined> {
+    return new Promise<T | undefined>(resolve => {
+        let remaining = promises.length;
+        for (const promise of promises) {
+            promise.then(value => {
+                if (value !== undefined) {
+                    resolve(value);
+                } else if (--remaining === 0) {
+                    resolve(undefined);
+                }
+            });
+        }
+    });
+}
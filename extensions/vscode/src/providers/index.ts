@@ -1,4 +1,4 @@
 export { ContextProvider } from './contextProvider';
-export { loadLocalConfig } from './localConfigProvider';
+export { clearLocalConfigCache, loadLocalConfig, setConfigSidecarDir } from './localConfigProvider';
 export { loadFromCli } from './cliProvider';
-export { loadFromKubernetes } from './kubernetesProvider';
+export { loadFromKubernetes, resetKubernetesClient } from './kubernetesProvider';
@@ -1,23 +1,90 @@
-import * as k8s from '@kubernetes/client-node';
+import * as fs from 'fs';
+import * as os from 'os';
+import * as path from 'path';
+import type * as k8s from '@kubernetes/client-node';
 import { ProjectContext } from '../types';
 import { getFullConfig } from '../config';
 
+/**
+ * API client built from a kubeconfig, reused while the file is unchanged
+ */
+interface CachedClient {
+    kubeconfigPath: string | undefined;
+    mtimeMs: number;
+    api: k8s.CustomObjectsApi;
+}
+
+let cachedClient: CachedClient | undefined;
+
+/**
+ * @kubernetes/client-node, loaded on first use so activation doesn't pay
+ * for its require tree when the user never reaches the Kubernetes source
+ */
+let k8sModule: typeof k8s | undefined;
+
+/**
+ * Resolve the kubeconfig file KubeConfig would read, for change detection
+ */
+function resolveKubeconfigFile(kubeconfigPath: string | undefined): string {
+    if (kubeconfigPath) {
+        return kubeconfigPath;
+    }
+    const fromEnv = process.env.KUBECONFIG?.split(path.delimiter)[0];
+    return fromEnv || path.join(os.homedir(), '.kube', 'config');
+}
+
+/**
+ * Return a CustomObjectsApi client, rebuilding it only when the configured
+ * kubeconfig path or the kubeconfig file's mtime changes.
+ */
+async function getCustomObjectsApi(kubeconfigPath: string | undefined): Promise<k8s.CustomObjectsApi> {
+    let mtimeMs = 0;
+    try {
+        mtimeMs = (await fs.promises.stat(resolveKubeconfigFile(kubeconfigPath))).mtimeMs;
+    } catch {
+        // No kubeconfig file (e.g. in-cluster config) - cache on the path alone
+    }
+
+    if (cachedClient && cachedClient.kubeconfigPath === kubeconfigPath && cachedClient.mtimeMs === mtimeMs) {
+        return cachedClient.api;
+    }
+
+    k8sModule ??= await import('@kubernetes/client-node');
+    const kc = new k8sModule.KubeConfig();
+    if (kubeconfigPath) {
+        kc.loadFromFile(kubeconfigPath);
+    } else {
+        kc.loadFromDefault();
+    }
+
+    const api = kc.makeApiClient(k8sModule.CustomObjectsApi);
+    cachedClient = { kubeconfigPath, mtimeMs, api };
+    return api;
+}
+
+/**
+ * Drop the cached Kubernetes client so the next call reloads kubeconfig
+ */
+export function resetKubernetesClient(): void {
+    cachedClient = undefined;
+}
+
 /**
  * Load project context from Kubernetes cluster as a Custom Resource.
  * Fetches ProjectContext CRD from the specified namespace.
  */
-export async function loadFromKubernetes(name: string, namespace?: string): Promise<ProjectContext | undefined> {
+export async function loadFromKubernetes(
+    name: string,
+    namespace?: string,
+    signal?: AbortSignal
+): Promise<ProjectContext | undefined> {
     try {
-        const kc = new k8s.KubeConfig();
-        const config = getFullConfig();
-
-        if (config.kubeconfigPath) {
-            kc.loadFromFile(config.kubeconfigPath);
-        } else {
-            kc.loadFromDefault();
+        if (signal?.aborted) {
+            return undefined;
         }
 
-        const k8sApi = kc.makeApiClient(k8s.CustomObjectsApi);
+        const config = getFullConfig();
+        const k8sApi = await getCustomObjectsApi(config.kubeconfigPath);
 
         // ProjectContext CRD details
         const group = 'contextcore.io';
@@ -33,6 +100,11 @@ export async function loadFromKubernetes(name: string, namespace?: string): Prom
             name
         );
 
+        // client-node 0.x requests can't be cancelled; drop results nobody awaits
+        if (signal?.aborted) {
+            return undefined;
+        }
+
         // Extract spec from Kubernetes resource
         const k8sResource = response.body as Record<string, unknown>;
         if (k8sResource && k8sResource.spec) {
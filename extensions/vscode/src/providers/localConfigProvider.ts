@@ -1,10 +1,110 @@
+import * as crypto from 'crypto';
 import * as vscode from 'vscode';
-import * as yaml from 'yaml';
+import type * as yaml from 'yaml';
 import { ProjectContext } from '../types';
+import { INLINE_PARSE_MAX_BYTES, parseYamlInWorker } from '../workers';
+
+/**
+ * Maximum number of parsed config files kept in memory.
+ */
+const CONFIG_CACHE_MAX_ENTRIES = 100;
+
+interface CachedConfig {
+    mtime: number;
+    size: number;
+    value: ProjectContext;
+}
+
+/**
+ * Parsed configs keyed by absolute path. Map iteration order is insertion
+ * order, so re-inserting on hit keeps the least recently used entry first.
+ */
+const configCache: Map<string, CachedConfig> = new Map();
+
+/**
+ * yaml package, loaded on the first cache miss that has no JSON sidecar
+ */
+let yamlModule: typeof yaml | undefined;
+
+/**
+ * Parse YAML, off the extension host thread for files large enough to
+ * block it noticeably. Falls back to an inline parse if the worker fails.
+ */
+async function parseYaml(text: string, size: number): Promise<unknown> {
+    if (size >= INLINE_PARSE_MAX_BYTES) {
+        try {
+            return await parseYamlInWorker(text);
+        } catch {
+            // Worker unavailable or crashed - parse inline below
+        }
+    }
+    yamlModule ??= await import('yaml');
+    return yamlModule.parse(text);
+}
+
+/**
+ * Directory holding JSON sidecars of parsed YAML configs. Unset until
+ * setConfigSidecarDir() is called, in which case sidecars are not used.
+ */
+let sidecarDir: vscode.Uri | undefined;
+
+/**
+ * Enable JSON sidecar caching under the given directory (normally
+ * context.globalStorageUri, so user repositories are never written to).
+ */
+export function setConfigSidecarDir(dir: vscode.Uri | undefined): void {
+    sidecarDir = dir;
+}
+
+function sidecarUriFor(dir: vscode.Uri, configPath: vscode.Uri): vscode.Uri {
+    const digest = crypto.createHash('sha1').update(configPath.fsPath).digest('hex').slice(0, 16);
+    return vscode.Uri.joinPath(dir, `${digest}.cache.json`);
+}
+
+/**
+ * Read the JSON sidecar for configPath if it is at least as new as the YAML.
+ */
+async function readSidecar(configPath: vscode.Uri, yamlMtime: number): Promise<unknown> {
+    if (!sidecarDir) {
+        return undefined;
+    }
+    const sidecarPath = sidecarUriFor(sidecarDir, configPath);
+    try {
+        const sidecarStat = await vscode.workspace.fs.stat(sidecarPath);
+        if (sidecarStat.mtime < yamlMtime) {
+            return undefined;
+        }
+        const data = await vscode.workspace.fs.readFile(sidecarPath);
+        return JSON.parse(Buffer.from(data).toString('utf8'));
+    } catch {
+        return undefined;
+    }
+}
+
+/**
+ * Write the JSON sidecar via a temp file and rename so readers never see a
+ * partial file. Failures only cost a YAML parse on the next activation.
+ */
+async function writeSidecar(configPath: vscode.Uri, context: ProjectContext): Promise<void> {
+    if (!sidecarDir) {
+        return;
+    }
+    const sidecarPath = sidecarUriFor(sidecarDir, configPath);
+    const tempPath = sidecarPath.with({ path: `${sidecarPath.path}.${process.pid}.tmp` });
+    try {
+        await vscode.workspace.fs.createDirectory(sidecarDir);
+        await vscode.workspace.fs.writeFile(tempPath, Buffer.from(JSON.stringify(context), 'utf8'));
+        await vscode.workspace.fs.rename(tempPath, sidecarPath, { overwrite: true });
+    } catch {
+        // Sidecar is an optimisation only
+    }
+}
 
 /**
  * Load project context from local configuration files.
  * Looks for .contextcore.yaml or .contextcore in workspace root.
+ * Parsed files are cached and reused while their mtime and size are unchanged,
+ * and a JSON sidecar (see setConfigSidecarDir) skips YAML parsing across sessions.
  */
 export async function loadLocalConfig(workspaceFolder: vscode.WorkspaceFolder): Promise<ProjectContext | undefined> {
     const configFiles = ['.contextcore.yaml', '.contextcore'];
@@ -12,11 +112,40 @@ export async function loadLocalConfig(workspaceFolder: vscode.WorkspaceFolder):
     for (const fileName of configFiles) {
         try {
             const configPath = vscode.Uri.joinPath(workspaceFolder.uri, fileName);
-            const configData = await vscode.workspace.fs.readFile(configPath);
-            const configText = Buffer.from(configData).toString('utf8');
+            const stat = await vscode.workspace.fs.stat(configPath);
+            const cacheKey = configPath.fsPath;
+
+            const cached = configCache.get(cacheKey);
+            if (cached && cached.mtime === stat.mtime && cached.size === stat.size) {
+                configCache.delete(cacheKey);
+                configCache.set(cacheKey, cached);
+                return structuredClone(cached.value);
+            }
 
-            const context = yaml.parse(configText) as ProjectContext;
-            return context;
+            let context = await readSidecar(configPath, stat.mtime);
+            if (context === undefined) {
+                const configData = await vscode.workspace.fs.readFile(configPath);
+                const configText = Buffer.from(configData).toString('utf8');
+
+                context = await parseYaml(configText, stat.size);
+                if (context && typeof context === 'object') {
+                    void writeSidecar(configPath, context as ProjectContext);
+                }
+            }
+            if (!context || typeof context !== 'object') {
+                configCache.delete(cacheKey);
+                continue;
+            }
+
+            configCache.delete(cacheKey);
+            configCache.set(cacheKey, { mtime: stat.mtime, size: stat.size, value: context as ProjectContext });
+            if (configCache.size > CONFIG_CACHE_MAX_ENTRIES) {
+                const oldest = configCache.keys().next().value;
+                if (oldest !== undefined) {
+                    configCache.delete(oldest);
+                }
+            }
+            return structuredClone(context as ProjectContext);
         } catch {
             // File not found or parsing error - continue to next file
             continue;
@@ -25,3 +154,10 @@ export async function loadLocalConfig(workspaceFolder: vscode.WorkspaceFolder):
 
     return undefined;
 }
+
+/**
+ * Drop all cached config parses; called when workspace folders change.
+ */
+export function clearLocalConfigCache(): void {
+    configCache.clear();
+}
@@ -2,12 +2,31 @@ import * as vscode from 'vscode';
 import { ContextMapper } from '../../mapping';
 import { getFullConfig } from '../../config';
 
+/**
+ * Trailing delay before recomputing decorations after an editor event
+ */
+const UPDATE_DEBOUNCE_MS = 150;
+
+/**
+ * Badge colour per criticality level
+ */
+const CRITICALITY_COLORS: Readonly<Record<string, string>> = Object.freeze({
+  critical: '#ff6b6b',
+  high: '#ffd93d',
+  medium: '#6bcb77',
+  low: '#4d96ff'
+});
+
+const DEFAULT_CRITICALITY_COLOR = '#888888';
+
 /**
  * Provides inline decorations for files with project context
  */
 export class DecorationProvider implements vscode.Disposable {
   private decorationType: vscode.TextEditorDecorationType;
   private disposables: vscode.Disposable[] = [];
+  private pending: Map<string, ReturnType<typeof setTimeout>> = new Map();
+  private enabled: boolean = getFullConfig().showInlineHints;
 
   constructor(private contextMapper: ContextMapper) {
     this.decorationType = vscode.window.createTextEditorDecorationType({
@@ -18,11 +37,21 @@ export class DecorationProvider implements vscode.Disposable {
       }
     });
 
+    // Track the inline hints setting instead of re-reading it per update
+    this.disposables.push(
+      vscode.workspace.onDidChangeConfiguration((event) => {
+        if (event.affectsConfiguration('contextcore.showInlineHints')) {
+          this.enabled = getFullConfig().showInlineHints;
+          vscode.window.visibleTextEditors.forEach(editor => this.updateDecorations(editor));
+        }
+      })
+    );
+
     // Listen for active editor changes
     this.disposables.push(
       vscode.window.onDidChangeActiveTextEditor((editor) => {
         if (editor) {
-          this.updateDecorations(editor);
+          this.scheduleUpdate(editor);
         }
       })
     );
@@ -32,7 +61,7 @@ export class DecorationProvider implements vscode.Disposable {
       vscode.workspace.onDidChangeTextDocument((event) => {
         const editor = vscode.window.activeTextEditor;
         if (editor && event.document === editor.document) {
-          this.updateDecorations(editor);
+          this.scheduleUpdate(editor);
         }
       })
     );
@@ -43,12 +72,32 @@ export class DecorationProvider implements vscode.Disposable {
     }
   }
 
+  /**
+   * Coalesce bursts of editor events into one trailing update per document
+   */
+  private scheduleUpdate(editor: vscode.TextEditor): void {
+    if (!this.enabled) {
+      return;
+    }
+    const key = editor.document.uri.toString();
+    const existing = this.pending.get(key);
+    if (existing) {
+      clearTimeout(existing);
+    }
+
+    this.pending.set(key, setTimeout(() => {
+      this.pending.delete(key);
+      if (!editor.document.isClosed) {
+        this.updateDecorations(editor);
+      }
+    }, UPDATE_DEBOUNCE_MS));
+  }
+
   /**
    * Update decorations for the given editor
    */
   private updateDecorations(editor: vscode.TextEditor): void {
-    const config = getFullConfig();
-    if (!config.showInlineHints) {
+    if (!this.enabled) {
       editor.setDecorations(this.decorationType, []);
       return;
     }
@@ -78,21 +127,12 @@ export class DecorationProvider implements vscode.Disposable {
    * Get color based on criticality level
    */
   private getCriticalityColor(criticality: string): string {
-    switch (criticality.toLowerCase()) {
-      case 'critical':
-        return '#ff6b6b';
-      case 'high':
-        return '#ffd93d';
-      case 'medium':
-        return '#6bcb77';
-      case 'low':
-        return '#4d96ff';
-      default:
-        return '#888888';
-    }
+    return CRITICALITY_COLORS[criticality.toLowerCase()] ?? DEFAULT_CRITICALITY_COLOR;
   }
 
   public dispose(): void {
+    this.pending.forEach(timer => clearTimeout(timer));
+    this.pending.clear();
     this.decorationType.dispose();
     this.disposables.forEach(d => d.dispose());
   }
@@ -9,6 +9,29 @@ export enum TreeItemType {
   Property = 'property'
 }
 
+/**
+ * Icons are immutable, so each one is built once and shared by all items
+ */
+const TYPE_ICONS: Readonly<Record<string, vscode.ThemeIcon>> = Object.freeze({
+  [TreeItemType.Project]: new vscode.ThemeIcon('project'),
+  [TreeItemType.Section]: new vscode.ThemeIcon('folder'),
+  [TreeItemType.Requirement]: new vscode.ThemeIcon('checklist'),
+  [TreeItemType.Target]: new vscode.ThemeIcon('target'),
+  [TreeItemType.Property]: new vscode.ThemeIcon('symbol-property')
+});
+
+const DEFAULT_ICON = new vscode.ThemeIcon('circle-outline');
+
+const RISK_ICONS: Readonly<Record<string, vscode.ThemeIcon>> = Object.freeze({
+  critical: new vscode.ThemeIcon('error', new vscode.ThemeColor('errorForeground')),
+  high: new vscode.ThemeIcon('warning', new vscode.ThemeColor('warningForeground')),
+  medium: new vscode.ThemeIcon('info', new vscode.ThemeColor('foreground')),
+  low: new vscode.ThemeIcon('circle-outline', new vscode.ThemeColor('descriptionForeground'))
+});
+
+const UNKNOWN_RISK_ICON = new vscode.ThemeIcon('question');
+const UNPRIORITISED_RISK_ICON = new vscode.ThemeIcon('warning');
+
 /**
  * Tree item for displaying context information in the side panel
  */
@@ -39,39 +62,16 @@ export class ContextTreeItem extends vscode.TreeItem {
    * Gets the appropriate icon based on type and priority
    */
   private getIcon(): vscode.ThemeIcon {
-    switch (this.type) {
-      case TreeItemType.Project:
-        return new vscode.ThemeIcon('project');
-      case TreeItemType.Section:
-        return new vscode.ThemeIcon('folder');
-      case TreeItemType.Risk:
-        return this.getRiskIcon();
-      case TreeItemType.Requirement:
-        return new vscode.ThemeIcon('checklist');
-      case TreeItemType.Target:
-        return new vscode.ThemeIcon('target');
-      case TreeItemType.Property:
-        return new vscode.ThemeIcon('symbol-property');
-      default:
-        return new vscode.ThemeIcon('circle-outline');
+    if (this.type === TreeItemType.Risk) {
+      return this.getRiskIcon();
     }
+    return TYPE_ICONS[this.type] ?? DEFAULT_ICON;
   }
 
   private getRiskIcon(): vscode.ThemeIcon {
     if (this.priority) {
-      switch (this.priority.toLowerCase()) {
-        case 'critical':
-          return new vscode.ThemeIcon('error', new vscode.ThemeColor('errorForeground'));
-        case 'high':
-          return new vscode.ThemeIcon('warning', new vscode.ThemeColor('warningForeground'));
-        case 'medium':
-          return new vscode.ThemeIcon('info', new vscode.ThemeColor('foreground'));
-        case 'low':
-          return new vscode.ThemeIcon('circle-outline', new vscode.ThemeColor('descriptionForeground'));
-        default:
-          return new vscode.ThemeIcon('question');
-      }
+      return RISK_ICONS[this.priority.toLowerCase()] ?? UNKNOWN_RISK_ICON;
     }
-    return new vscode.ThemeIcon('warning');
+    return UNPRIORITISED_RISK_ICON;
   }
 }
@@ -27,13 +27,20 @@ export class ProjectTreeProvider implements vscode.TreeDataProvider<ContextTreeI
 
   private disposables: vscode.Disposable[] = [];
 
+  // Current tree state, kept so updates can target only the changed subtree
+  private current?: FlattenedContext;
+  private rootItem?: ContextTreeItem;
+  private sectionItems: Map<string, ContextTreeItem> = new Map();
+  private snapshots: Map<string, string> = new Map();
+  private childrenCache: WeakMap<ContextTreeItem, ContextTreeItem[]> = new WeakMap();
+
   constructor(private contextMapper: ContextMapper) {
     this.disposables.push(this._onDidChangeTreeData);
 
     // Listen for active editor changes
     this.disposables.push(
       vscode.window.onDidChangeActiveTextEditor(() => {
-        this.refresh();
+        this.update();
       })
     );
   }
@@ -48,14 +55,24 @@ export class ProjectTreeProvider implements vscode.TreeDataProvider<ContextTreeI
         return this.getRootElements();
       }
 
+      const cached = this.childrenCache.get(element);
+      if (cached) {
+        return cached;
+      }
+
+      let children: ContextTreeItem[];
       switch (element.type) {
         case TreeItemType.Project:
-          return this.getProjectChildren(element);
+          children = this.getProjectChildren();
+          break;
         case TreeItemType.Section:
-          return this.getSectionChildren(element);
+          children = this.getSectionChildren(element);
+          break;
         default:
-          return [];
+          children = [];
       }
+      this.childrenCache.set(element, children);
+      return children;
     } catch (error) {
       console.error('Error getting tree children:', error);
       return [];
@@ -63,8 +80,13 @@ export class ProjectTreeProvider implements vscode.TreeDataProvider<ContextTreeI
   }
 
   private getRootElements(): ContextTreeItem[] {
-    const activeEditor = vscode.window.activeTextEditor;
-    if (!activeEditor) {
+    const context = this.getActiveContext();
+    this.current = context;
+    this.snapshots = context ? this.takeSnapshots(context) : new Map();
+    this.sectionItems.clear();
+    this.rootItem = undefined;
+
+    if (!vscode.window.activeTextEditor) {
       return [new ContextTreeItem(
         'No active file',
         vscode.TreeItemCollapsibleState.None,
@@ -72,7 +94,6 @@ export class ProjectTreeProvider implements vscode.TreeDataProvider<ContextTreeI
       )];
     }
 
-    const context = this.contextMapper.getContextForFile(activeEditor.document.uri.fsPath) as FlattenedContext | undefined;
     if (!context) {
       return [new ContextTreeItem(
         'No context available',
@@ -81,16 +102,21 @@ export class ProjectTreeProvider implements vscode.TreeDataProvider<ContextTreeI
       )];
     }
 
-    return [new ContextTreeItem(
+    this.rootItem = new ContextTreeItem(
       context.projectId,
       vscode.TreeItemCollapsibleState.Expanded,
       TreeItemType.Project,
       context
-    )];
+    );
+    return [this.rootItem];
   }
 
-  private getProjectChildren(element: ContextTreeItem): ContextTreeItem[] {
-    const context = element.value as FlattenedContext;
+  private getProjectChildren(): ContextTreeItem[] {
+    const context = this.current;
+    if (!context) {
+      return [];
+    }
+    this.sectionItems.clear();
     const children: ContextTreeItem[] = [];
 
     // Project properties
@@ -112,32 +138,42 @@ export class ProjectTreeProvider implements vscode.TreeDataProvider<ContextTreeI
 
     // Risks section
     if (context.risks && context.risks.length > 0) {
-      children.push(new ContextTreeItem(
+      const risksItem = new ContextTreeItem(
         'Risks',
         vscode.TreeItemCollapsibleState.Collapsed,
         TreeItemType.Section,
         context.risks,
         undefined,
         context.risks.length
-      ));
+      );
+      this.sectionItems.set('Risks', risksItem);
+      children.push(risksItem);
     }
 
     // Requirements section
     if (context.requirements) {
-      children.push(new ContextTreeItem(
+      const requirementsItem = new ContextTreeItem(
         'Requirements',
         vscode.TreeItemCollapsibleState.Collapsed,
         TreeItemType.Section,
         context.requirements
-      ));
+      );
+      this.sectionItems.set('Requirements', requirementsItem);
+      children.push(requirementsItem);
     }
 
     return children;
   }
 
   private getSectionChildren(element: ContextTreeItem): ContextTreeItem[] {
+    const context = this.current;
+    if (!context) {
+      return [];
+    }
+
+    // Read from the current context so a re-fired section shows fresh data
     if (element.label === 'Risks') {
-      const risks = element.value as { id?: string; description?: string; severity?: string }[];
+      const risks = context.risks || [];
       return risks.map((risk) =>
         new ContextTreeItem(
           risk.description || risk.id || 'Risk',
@@ -150,8 +186,8 @@ export class ProjectTreeProvider implements vscode.TreeDataProvider<ContextTreeI
     }
 
     if (element.label === 'Requirements') {
-      const requirements = element.value as { targets?: { metric: string; threshold: string }[] };
-      if (requirements.targets) {
+      const requirements = context.requirements;
+      if (requirements?.targets) {
         return requirements.targets.map((target) =>
           new ContextTreeItem(
             `${target.metric}: ${target.threshold}`,
@@ -167,9 +203,73 @@ export class ProjectTreeProvider implements vscode.TreeDataProvider<ContextTreeI
   }
 
   public refresh(): void {
+    this.current = undefined;
+    this.rootItem = undefined;
+    this.sectionItems.clear();
+    this.snapshots.clear();
+    this.childrenCache = new WeakMap();
     this._onDidChangeTreeData.fire();
   }
 
+  /**
+   * Re-render only what changed for the active file: nothing if its context
+   * is unchanged, one section if only that section differs, the project node
+   * if its own properties differ, and the whole tree for another project.
+   */
+  private update(): void {
+    const next = this.getActiveContext();
+    if (!next || !this.current || !this.rootItem || next.projectId !== this.current.projectId) {
+      this.refresh();
+      return;
+    }
+
+    const nextSnapshots = this.takeSnapshots(next);
+    const changed = [...nextSnapshots.keys()].filter(key => nextSnapshots.get(key) !== this.snapshots.get(key));
+    if (changed.length === 0) {
+      return;
+    }
+
+    this.current = next;
+    this.snapshots = nextSnapshots;
+    if (changed.includes('project')) {
+      this.childrenCache.delete(this.rootItem);
+      this._onDidChangeTreeData.fire(this.rootItem);
+      return;
+    }
+
+    for (const label of changed) {
+      const section = this.sectionItems.get(label);
+      if (section) {
+        this.childrenCache.delete(section);
+        this._onDidChangeTreeData.fire(section);
+      }
+    }
+  }
+
+  private getActiveContext(): FlattenedContext | undefined {
+    const activeEditor = vscode.window.activeTextEditor;
+    if (!activeEditor) {
+      return undefined;
+    }
+    return this.contextMapper.getContextForFile(activeEditor.document.uri.fsPath) as FlattenedContext | undefined;
+  }
+
+  /**
+   * Per-node fingerprints; configs are small enough that JSON is fine here
+   */
+  private takeSnapshots(context: FlattenedContext): Map<string, string> {
+    return new Map([
+      ['project', JSON.stringify([
+        context.criticality,
+        context.owner,
+        context.risks?.length ?? 0,
+        context.requirements !== undefined
+      ])],
+      ['Risks', JSON.stringify(context.risks ?? [])],
+      ['Requirements', JSON.stringify(context.requirements ?? {})]
+    ]);
+  }
+
   public dispose(): void {
     this.disposables.forEach(d => d.dispose());
   }
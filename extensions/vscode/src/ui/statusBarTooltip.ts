@@ -15,36 +15,65 @@ interface FlattenedContext {
 }
 
 /**
- * Builds a formatted tooltip for the status bar item
+ * Tooltip layout; optional lines are filled in whole or left empty
  */
-export function buildTooltip(context: FlattenedContext): vscode.MarkdownString {
-  const tooltip = new vscode.MarkdownString();
-  tooltip.supportHtml = true;
-  tooltip.isTrusted = true;
-
-  tooltip.appendMarkdown(`**Project Context**\n\n`);
-  tooltip.appendMarkdown(`**Project ID:** ${context.projectId}\n`);
-  tooltip.appendMarkdown(`**Criticality:** ${context.criticality}\n`);
+const TOOLTIP_TEMPLATE =
+  '**Project Context**\n\n' +
+  '**Project ID:** {projectId}\n' +
+  '**Criticality:** {criticality}\n' +
+  '{owner}{risks}{targets}{requirements}';
 
-  if (context.owner) {
-    tooltip.appendMarkdown(`**Owner:** ${context.owner}\n`);
-  }
+const TOOLTIP_PLACEHOLDER = /\{(\w+)\}/g;
 
-  if (context.risks?.length) {
-    tooltip.appendMarkdown(`**Risks:** ${context.risks.length} identified\n`);
-  }
+/**
+ * Recently built tooltips, keyed by their filled-in fields (LRU)
+ */
+const TOOLTIP_CACHE_MAX_ENTRIES = 32;
+const tooltipCache: Map<string, vscode.MarkdownString> = new Map();
 
-  if (context.requirements?.targets?.length) {
-    const targetCount = context.requirements.targets.length;
-    tooltip.appendMarkdown(`**SLO Targets:** ${targetCount} defined\n`);
-  }
+/**
+ * Builds a formatted tooltip for the status bar item
+ */
+export function buildTooltip(context: FlattenedContext): vscode.MarkdownString {
+  const fields: Record<string, string> = {
+    projectId: context.projectId,
+    criticality: context.criticality,
+    owner: context.owner ? `**Owner:** ${context.owner}\n` : '',
+    risks: context.risks?.length ? `**Risks:** ${context.risks.length} identified\n` : '',
+    targets: context.requirements?.targets?.length
+      ? `**SLO Targets:** ${context.requirements.targets.length} defined\n`
+      : '',
+    requirements: ''
+  };
 
   if (context.requirements?.description) {
     const summary = context.requirements.description.length > 100
       ? context.requirements.description.substring(0, 100) + '...'
       : context.requirements.description;
-    tooltip.appendMarkdown(`\n**Requirements:** ${summary}\n`);
+    fields.requirements = `\n**Requirements:** ${summary}\n`;
+  }
+
+  // Files sharing a context hit the same entry and reuse one MarkdownString
+  const key = Object.values(fields).join('\u0000');
+  const cached = tooltipCache.get(key);
+  if (cached) {
+    tooltipCache.delete(key);
+    tooltipCache.set(key, cached);
+    return cached;
   }
 
+  const tooltip = new vscode.MarkdownString(
+    TOOLTIP_TEMPLATE.replace(TOOLTIP_PLACEHOLDER, (_match, name: string) => fields[name] ?? '')
+  );
+  tooltip.supportHtml = true;
+  tooltip.isTrusted = true;
+
+  tooltipCache.set(key, tooltip);
+  if (tooltipCache.size > TOOLTIP_CACHE_MAX_ENTRIES) {
+    const oldest = tooltipCache.keys().next().value;
+    if (oldest !== undefined) {
+      tooltipCache.delete(oldest);
+    }
+  }
   return tooltip;
 }
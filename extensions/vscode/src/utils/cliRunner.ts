@@ -4,6 +4,37 @@ import * as logger from '../logger';
 
 const execAsync = promisify(exec);
 
+/**
+ * Maximum number of contextcore processes running at once
+ */
+const MAX_CONCURRENT_COMMANDS = 2;
+
+/**
+ * Running commands keyed by cwd and command line; identical requests share one process
+ */
+const inflight: Map<string, Promise<string>> = new Map();
+
+let runningCommands = 0;
+const waitingCommands: (() => void)[] = [];
+
+async function acquireSlot(): Promise<void> {
+  if (runningCommands < MAX_CONCURRENT_COMMANDS) {
+    runningCommands++;
+    return;
+  }
+  // The releasing command hands its slot straight to us
+  await new Promise<void>(resolve => waitingCommands.push(resolve));
+}
+
+function releaseSlot(): void {
+  const next = waitingCommands.shift();
+  if (next) {
+    next();
+  } else {
+    runningCommands--;
+  }
+}
+
 interface CliOptions {
   timeout?: number;
   maxBuffer?: number;
@@ -12,14 +43,36 @@ interface CliOptions {
 
 /**
  * Executes a ContextCore CLI command
+ * Concurrent calls with the same command and cwd share one process, and at
+ * most MAX_CONCURRENT_COMMANDS processes run at a time.
  * @param command - The command to execute (without 'contextcore' prefix)
  * @param options - Additional execution options
  * @returns Promise resolving to command output
  */
-export async function runContextCoreCommand(
+export function runContextCoreCommand(
   command: string,
   options: CliOptions = {}
 ): Promise<string> {
+  const key = `${options.cwd ?? process.cwd()}\u0000${command}`;
+  const existing = inflight.get(key);
+  if (existing) {
+    return existing;
+  }
+
+  const run = (async () => {
+    await acquireSlot();
+    try {
+      return await executeCommand(command, options);
+    } finally {
+      releaseSlot();
+    }
+  })().finally(() => inflight.delete(key));
+
+  inflight.set(key, run);
+  return run;
+}
+
+async function executeCommand(command: string, options: CliOptions): Promise<string> {
   const {
     timeout = 30000,
     maxBuffer = 1024 * 1024 * 10, // 10MB
@@ -2,16 +2,21 @@
 import * as vscode from 'vscode';
 import { ContextMapper } from '../../core/contextMapper';
 import { findHttpHandlers, findDatabaseQueries, findExternalCalls, buildSloDecoration } from './sloDecorations';
-import { isFileInRiskScope, buildRiskDecoration } from './riskDecorations';
+import { isFileInRiskScope, applyRiskDecorations, clearRiskDecorations, disposeRiskDecorationTypes } from './riskDecorations';
+
+/**
+ * Languages with handler/query patterns worth scanning
+ */
+const SUPPORTED_LANGUAGES: ReadonlySet<string> = new Set(['python', 'typescript', 'javascript', 'typescriptreact', 'go']);
 
 /**
  * Manages editor decorations for inline SLO hints and risk indicators
  */
 export class DecorationProvider implements vscode.Disposable {
     private readonly sloDecorationType: vscode.TextEditorDecorationType;
-    private readonly riskDecorationType: vscode.TextEditorDecorationType;
     private readonly disposables: vscode.Disposable[] = [];
     private updateTimeout: NodeJS.Timeout | undefined;
+    private enabled: boolean;
 
     constructor(private readonly contextMapper: ContextMapper) {
         this.sloDecorationType = vscode.window.createTextEditorDecorationType({
@@ -22,7 +27,7 @@ export class DecorationProvider implements vscode.Disposable {
             }
         });
 
-        this.riskDecorationType = vscode.window.createTextEditorDecorationType({});
+        this.enabled = this.isInlineHintsEnabled();
 
         this.registerEventListeners();
         this.updateActiveEditor();
@@ -32,17 +37,13 @@ export class DecorationProvider implements vscode.Disposable {
      * Updates decorations for the given editor
      */
     public async updateDecorations(editor: vscode.TextEditor): Promise<void> {
-        if (!this.isInlineHintsEnabled()) {
+        const document = editor.document;
+        if (!this.enabled || !SUPPORTED_LANGUAGES.has(document.languageId)) {
             this.clearDecorations(editor);
             return;
         }
 
         try {
-            const document = editor.document;
-            if (!this.isSupportedLanguage(document.languageId)) {
-                this.clearDecorations(editor);
-                return;
-            }
 
             // Find relevant code patterns
             const httpHandlers = findHttpHandlers(document);
@@ -60,8 +61,7 @@ export class DecorationProvider implements vscode.Disposable {
             // Check for risk scope and apply risk decorations
             const risks = await this.contextMapper.getRisks();
             const fileRisk = isFileInRiskScope(filePath, risks);
-            const riskDecorations = fileRisk ? buildRiskDecoration(fileRisk) : [];
-            editor.setDecorations(this.riskDecorationType, riskDecorations);
+            applyRiskDecorations(editor, fileRisk);
 
         } catch (error) {
             console.error('Error updating decorations:', error);
@@ -74,7 +74,7 @@ export class DecorationProvider implements vscode.Disposable {
             clearTimeout(this.updateTimeout);
         }
         this.sloDecorationType.dispose();
-        this.riskDecorationType.dispose();
+        disposeRiskDecorationTypes();
         this.disposables.forEach(d => d.dispose());
     }
 
@@ -93,6 +93,7 @@ export class DecorationProvider implements vscode.Disposable {
             }),
             vscode.workspace.onDidChangeConfiguration(event => {
                 if (event.affectsConfiguration('contextcore.showInlineHints')) {
+                    this.enabled = this.isInlineHintsEnabled();
                     this.updateAllVisibleEditors();
                 }
             })
@@ -100,6 +101,9 @@ export class DecorationProvider implements vscode.Disposable {
     }
 
     private scheduleUpdate(editor: vscode.TextEditor): void {
+        if (!this.enabled || !SUPPORTED_LANGUAGES.has(editor.document.languageId)) {
+            return;
+        }
         if (this.updateTimeout) {
             clearTimeout(this.updateTimeout);
         }
@@ -126,13 +130,9 @@ export class DecorationProvider implements vscode.Disposable {
         return config.get<boolean>('showInlineHints', true);
     }
 
-    private isSupportedLanguage(languageId: string): boolean {
-        return ['python', 'typescript', 'javascript', 'go'].includes(languageId);
-    }
-
     private clearDecorations(editor: vscode.TextEditor): void {
         editor.setDecorations(this.sloDecorationType, []);
-        editor.setDecorations(this.riskDecorationType, []);
+        clearRiskDecorations(editor);
     }
 }
 
@@ -153,26 +153,52 @@ export interface Requirements {
     availability: number;
 }
 
+/**
+ * One compiled alternation per language, so a document is scanned once.
+ * Python/TypeScript alternatives expose their captures as named groups.
+ */
+const EXPRESS_HANDLER_REGEX = /(?:app|router)\.(?<apiMethod>get|post|put|delete)\s*\(\s*['"](?<apiPath>[^'"]+)['"]/g;
+
+const HTTP_HANDLER_REGEXES: ReadonlyMap<string, RegExp> = new Map([
+    [
+        'python',
+        /@app\.route\s*\(\s*['"](?<route>[^'"]+)['"]|@app\.(?<apiMethod>get|post|put|delete)\s*\(\s*['"](?<apiPath>[^'"]+)['"]|def\s+(?<defMethod>get_|post_|put_|delete_)\w*/g
+    ],
+    ['typescript', EXPRESS_HANDLER_REGEX],
+    ['typescriptreact', EXPRESS_HANDLER_REGEX],
+    ['javascript', EXPRESS_HANDLER_REGEX],
+    ['go', /func\s+\w*[Hh]andler?\w*\s*\(|http\.HandleFunc\s*\(/g]
+]);
+
 /**
  * Finds HTTP handler patterns in the document
  */
 export function findHttpHandlers(document: vscode.TextDocument): CodePattern[] {
     const patterns: CodePattern[] = [];
-    const text = document.getText();
-    const languageId = document.languageId;
+    const regex = HTTP_HANDLER_REGEXES.get(document.languageId);
+    if (!regex) {
+        return patterns;
+    }
 
     try {
-        switch (languageId) {
-            case 'python':
-                patterns.push(...findPythonHttpHandlers(document, text));
-                break;
-            case 'typescript':
-            case 'javascript':
-                patterns.push(...findTypeScriptHttpHandlers(document, text));
-                break;
-            case 'go':
-                patterns.push(...findGoHttpHandlers(document, text));
-                break;
+        const text = document.getText();
+        for (const match of text.matchAll(regex)) {
+            if (match.index === undefined) {
+                continue;
+            }
+            const start = document.positionAt(match.index);
+            const end = document.positionAt(match.index + match[0].length);
+            const pattern: CodePattern = {
+                range: new vscode.Range(start, end),
+                type: 'http'
+            };
+
+            const groups = match.groups;
+            if (groups) {
+                pattern.method = groups.apiMethod ?? groups.defMethod ?? groups.route ?? 'unknown';
+                pattern.endpoint = groups.apiPath ?? '';
+            }
+            patterns.push(pattern);
         }
     } catch (error) {
         console.error('Error finding HTTP handlers:', error);
@@ -261,80 +287,6 @@ export function buildSloDecoration(patterns: CodePattern[], requirements?: Requi
 }
 
 // Private helper functions
-function findPythonHttpHandlers(document: vscode.TextDocument, text: string): CodePattern[] {
-    const patterns: CodePattern[] = [];
-    
-    // Flask/FastAPI patterns
-    const flaskRegex = /@app\.route\s*\(\s*['"]([^'"]+)['"]/g;
-    const fastApiRegex = /@app\.(get|post|put|delete)\s*\(\s*['"]([^'"]+)['"]/g;
-    const defRegex = /def\s+(get_|post_|put_|delete_)\w*/g;
-
-    [flaskRegex, fastApiRegex, defRegex].forEach(regex => {
-        const matches = text.matchAll(regex);
-        for (const match of matches) {
-            if (match.index !== undefined) {
-                const start = document.positionAt(match.index);
-                const end = document.positionAt(match.index + match[0].length);
-                patterns.push({
-                    range: new vscode.Range(start, end),
-                    type: 'http',
-                    method: match[1] || 'unknown',
-                    endpoint: match[2] || ''
-                });
-            }
-        }
-    });
-
-    return patterns;
-}
-
-function findTypeScriptHttpHandlers(document: vscode.TextDocument, text: string): CodePattern[] {
-    const patterns: CodePattern[] = [];
-    
-    // Express.js patterns
-    const expressRegex = /(?:app|router)\.(get|post|put|delete)\s*\(\s*['"]([^'"]+)['"]/g;
-    const matches = text.matchAll(expressRegex);
-
-    for (const match of matches) {
-        if (match.index !== undefined) {
-            const start = document.positionAt(match.index);
-            const end = document.positionAt(match.index + match[0].length);
-            patterns.push({
-                range: new vscode.Range(start, end),
-                type: 'http',
-                method: match[1],
-                endpoint: match[2]
-            });
-        }
-    }
-
-    return patterns;
-}
-
-function findGoHttpHandlers(document: vscode.TextDocument, text: string): CodePattern[] {
-    const patterns: CodePattern[] = [];
-    
-    // Go HTTP patterns
-    const handlerRegex = /func\s+\w*[Hh]andler?\w*\s*\(/g;
-    const handleFuncRegex = /http\.HandleFunc\s*\(/g;
-
-    [handlerRegex, handleFuncRegex].forEach(regex => {
-        const matches = text.matchAll(regex);
-        for (const match of matches) {
-            if (match.index !== undefined) {
-                const start = document.positionAt(match.index);
-                const end = document.positionAt(match.index + match[0].length);
-                patterns.push({
-                    range: new vscode.Range(start, end),
-                    type: 'http'
-                });
-            }
-        }
-    });
-
-    return patterns;
-}
-
 function formatSloText(type: string, requirements: Requirements): string {
     switch (type) {
         case 'http':
@@ -361,50 +313,102 @@ export interface Risk {
     impact: string;
 }
 
+type RiskPriority = Risk['priority'];
+
+/**
+ * Priorities from most to least severe
+ */
+const RISK_PRIORITIES: readonly RiskPriority[] = ['P1', 'P2', 'P3'];
+
+const RISK_ICON_FILES: Readonly<Record<RiskPriority, string>> = Object.freeze({
+    'P1': 'red-circle.svg',
+    'P2': 'orange-circle.svg',
+    'P3': 'yellow-circle.svg'
+});
+
+/**
+ * One gutter decoration type per priority, created on first use and reused
+ * for every editor so updates only swap range arrays.
+ */
+let riskDecorationTypes: Record<RiskPriority, vscode.TextEditorDecorationType> | undefined;
+
+function getRiskDecorationTypes(): Record<RiskPriority, vscode.TextEditorDecorationType> {
+    if (!riskDecorationTypes) {
+        const create = (priority: RiskPriority) => vscode.window.createTextEditorDecorationType({
+            gutterIconPath: getRiskIconUri(priority),
+            gutterIconSize: 'contain'
+        });
+        riskDecorationTypes = { 'P1': create('P1'), 'P2': create('P2'), 'P3': create('P3') };
+    }
+    return riskDecorationTypes;
+}
+
 /**
- * Checks if a file is in the scope of any risk
+ * Checks if a file is in the scope of any risk.
+ * Returns the highest-priority matching risk, stopping at the first P1.
  */
 export function isFileInRiskScope(filePath: string, risks: Risk[]): Risk | undefined {
     const normalizedPath = path.normalize(filePath);
-    
-    return risks.find(risk => 
-        risk.files.some(riskFile => {
+    let best: Risk | undefined;
+
+    for (const risk of risks) {
+        if (best && RISK_PRIORITIES.indexOf(risk.priority) >= RISK_PRIORITIES.indexOf(best.priority)) {
+            continue;
+        }
+        const inScope = risk.files.some(riskFile => {
             const normalizedRiskFile = path.normalize(riskFile);
-            return normalizedPath.includes(normalizedRiskFile) || 
+            return normalizedPath.includes(normalizedRiskFile) ||
                    normalizedRiskFile.includes(normalizedPath);
-        })
-    );
+        });
+        if (inScope) {
+            best = risk;
+            if (risk.priority === RISK_PRIORITIES[0]) {
+                break;
+            }
+        }
+    }
+    return best;
 }
 
 /**
  * Builds risk decoration for gutter display
  */
 export function buildRiskDecoration(risk: Risk): vscode.DecorationOptions[] {
-    const iconUri = getRiskIconUri(risk.priority);
     const hoverMessage = new vscode.MarkdownString(
         `**${risk.priority} Risk: ${risk.title}**\n\n${risk.description}\n\n*Impact: ${risk.impact}*`
     );
 
     return [{
         range: new vscode.Range(0, 0, 0, 0),
-        hoverMessage,
-        renderOptions: {
-            gutterIconPath: iconUri,
-            gutterIconSize: 'contain'
-        }
+        hoverMessage
     }];
 }
 
+/**
+ * Shows the gutter icon for the given risk (or none) using the shared types
+ */
+export function applyRiskDecorations(editor: vscode.TextEditor, risk: Risk | undefined): void {
+    const types = getRiskDecorationTypes();
+    for (const priority of RISK_PRIORITIES) {
+        editor.setDecorations(types[priority], risk?.priority === priority ? buildRiskDecoration(risk) : []);
+    }
+}
+
+export function clearRiskDecorations(editor: vscode.TextEditor): void {
+    applyRiskDecorations(editor, undefined);
+}
+
+export function disposeRiskDecorationTypes(): void {
+    if (riskDecorationTypes) {
+        RISK_PRIORITIES.forEach(priority => riskDecorationTypes![priority].dispose());
+        riskDecorationTypes = undefined;
+    }
+}
+
 /**
  * Gets the appropriate icon URI for the risk priority
  */
-function getRiskIconUri(priority: 'P1' | 'P2' | 'P3'): vscode.Uri {
+function getRiskIconUri(priority: RiskPriority): vscode.Uri {
     const extensionPath = vscode.extensions.getExtension('contextcore')?.extensionPath || '';
-    const iconMap = {
-        'P1': 'red-circle.svg',
-        'P2': 'orange-circle.svg',
-        'P3': 'yellow-circle.svg'
-    };
-    
-    return vscode.Uri.file(path.join(extensionPath, 'resources', 'icons', iconMap[priority]));
+    return vscode.Uri.file(path.join(extensionPath, 'resources', 'icons', RISK_ICON_FILES[priority]));
 }
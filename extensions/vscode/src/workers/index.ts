@@ -0,0 +1 @@
+export { parseYamlInWorker, disposeYamlWorkers, INLINE_PARSE_MAX_BYTES } from './yamlPool';
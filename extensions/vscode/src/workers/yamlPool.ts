@@ -0,0 +1,99 @@
+import * as os from 'os';
+import * as path from 'path';
+import { Worker } from 'worker_threads';
+import type { YamlParseRequest, YamlParseResponse } from './yamlWorker';
+
+/**
+ * Below this size a worker round trip costs more than parsing inline
+ */
+export const INLINE_PARSE_MAX_BYTES = 16 * 1024;
+
+const POOL_SIZE = Math.max(1, Math.min(4, os.cpus().length));
+
+interface PendingParse {
+  resolve: (value: unknown) => void;
+  reject: (error: Error) => void;
+}
+
+const workers: Worker[] = [];
+const pending: Map<number, PendingParse> = new Map();
+// Request ids each live worker has yet to answer
+const held: Map<Worker, Set<number>> = new Map();
+let nextWorker = 0;
+let nextId = 0;
+
+function handleResponse(worker: Worker, response: YamlParseResponse): void {
+  held.get(worker)?.delete(response.id);
+  const entry = pending.get(response.id);
+  if (!entry) {
+    return;
+  }
+  pending.delete(response.id);
+  if (response.error !== undefined) {
+    entry.reject(new Error(response.error));
+  } else {
+    entry.resolve(response.value);
+  }
+}
+
+/**
+ * Drop a dead worker from the pool and fail only the parses it was holding
+ */
+function failWorker(worker: Worker, error: Error): void {
+  const ids = held.get(worker);
+  if (!ids) {
+    return;
+  }
+  held.delete(worker);
+  const index = workers.indexOf(worker);
+  if (index !== -1) {
+    workers.splice(index, 1);
+  }
+  ids.forEach(id => {
+    pending.get(id)?.reject(error);
+    pending.delete(id);
+  });
+}
+
+function createWorker(): Worker {
+  const worker = new Worker(path.join(__dirname, 'yamlWorker.js'));
+  held.set(worker, new Set());
+  worker.on('message', (response: YamlParseResponse) => handleResponse(worker, response));
+  // A crashed worker is replaced lazily on the next parse
+  worker.on('error', (error) => failWorker(worker, error));
+  worker.on('exit', (code) => failWorker(worker, new Error(`YAML worker exited with code ${code}`)));
+  // Don't keep the extension host alive for idle parse workers
+  worker.unref();
+  return worker;
+}
+
+/**
+ * Parse YAML text on a pooled worker thread (round-robin dispatch)
+ */
+export function parseYamlInWorker(text: string): Promise<unknown> {
+  if (workers.length < POOL_SIZE) {
+    workers.push(createWorker());
+  }
+  const worker = workers[nextWorker++ % workers.length];
+  const id = nextId++;
+
+  return new Promise<unknown>((resolve, reject) => {
+    pending.set(id, { resolve, reject });
+    held.get(worker)?.add(id);
+    const request: YamlParseRequest = { id, text };
+    worker.postMessage(request);
+  });
+}
+
+/**
+ * Terminate all parse workers
+ */
+export function disposeYamlWorkers(): void {
+  // Forget the workers first so their exit events are not treated as crashes
+  held.clear();
+  workers.splice(0).forEach(worker => {
+    worker.terminate().catch(() => undefined);
+  });
+  pending.forEach(entry => entry.reject(new Error('YAML worker pool disposed')));
+  pending.clear();
+}
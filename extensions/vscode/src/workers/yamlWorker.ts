@@ -0,0 +1,30 @@
+import { parentPort } from 'worker_threads';
+import * as yaml from 'yaml';
+
+/**
+ * Request posted by the parse pool
+ */
+export interface YamlParseRequest {
+  id: number;
+  text: string;
+}
+
+/**
+ * Reply posted back to the parse pool
+ */
+export interface YamlParseResponse {
+  id: number;
+  value?: unknown;
+  error?: string;
+}
+
+// Parse YAML off the extension host thread; the result is structured-cloned back
+parentPort?.on('message', (request: YamlParseRequest) => {
+  let response: YamlParseResponse;
+  try {
+    response = { id: request.id, value: yaml.parse(request.text) };
+  } catch (error) {
+    response = { id: request.id, error: error instanceof Error ? error.message : String(error) };
+  }
+  parentPort?.postMessage(response);
+});
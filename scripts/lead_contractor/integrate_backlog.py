@@ -31,6 +31,17 @@ from dataclasses import dataclass, field
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+# Patterns used for every generated file scanned by analyze_file_content and
+# detect_incomplete_file, compiled once at import
+_CLASS_DEF_RE = re.compile(r'^class\s+([A-Za-z_][A-Za-z0-9_]*)', re.MULTILINE)
+_FUNCTION_DEF_RE = re.compile(r'^def\s+([A-Za-z_][A-Za-z0-9_]*)', re.MULTILINE)
+_IMPORT_RE = re.compile(r'^(?:from|import)\s+([^\s]+)', re.MULTILINE)
+_BARE_IDENTIFIER_RE = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*\s*$')
+_BARE_ASSIGNMENT_RE = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*\s*=\s*$')
+_BARE_DOTTED_NAME_RE = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_.]*\s*$')
+_DUNDER_ALL_RE = re.compile(r"__all__\s*=\s*\[([^\]]+)\]")
+_QUOTED_NAME_RE = re.compile(r"['\"]([a-zA-Z_][a-zA-Z0-9_]*)['\"]")
+
 
 @dataclass
 class GeneratedFile:
@@ -348,9 +359,9 @@ def analyze_file_content(file_path: Path) -> Dict[str, any]:
             content = f.read()
         
         # Extract key identifiers (classes, functions, imports)
-        classes = re.findall(r'^class\s+([A-Za-z_][A-Za-z0-9_]*)', content, re.MULTILINE)
-        functions = re.findall(r'^def\s+([A-Za-z_][A-Za-z0-9_]*)', content, re.MULTILINE)
-        imports = re.findall(r'^(?:from|import)\s+([^\s]+)', content, re.MULTILINE)
+        classes = _CLASS_DEF_RE.findall(content)
+        functions = _FUNCTION_DEF_RE.findall(content)
+        imports = _IMPORT_RE.findall(content)
         
         return {
             'size': len(content),
@@ -919,13 +930,13 @@ def detect_incomplete_file(content: str, file_path: Path) -> List[str]:
     # Check if last line looks incomplete (ends with identifier but no statement)
     if last_line and not last_line.endswith((':', ')', ']', '}', '"""', "'''", '"""', "'''", ',', '#')):
         # Check if it's just an identifier without assignment or function call
-        if re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*\s*$', last_line):
+        if _BARE_IDENTIFIER_RE.match(last_line):
             issues.append(f"TRUNCATED: File ends with incomplete identifier: '{last_line}'")
         # Check for incomplete assignment (e.g., "x = ")
-        elif re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*\s*=\s*$', last_line):
+        elif _BARE_ASSIGNMENT_RE.match(last_line):
             issues.append(f"TRUNCATED: File ends with incomplete assignment: '{last_line}'")
         # Check for incomplete method call (e.g., "foo.bar")
-        elif re.match(r'^[a-zA-Z_][a-zA-Z0-9_.]*\s*$', last_line) and '.' in last_line:
+        elif _BARE_DOTTED_NAME_RE.match(last_line) and '.' in last_line:
             issues.append(f"TRUNCATED: File ends with incomplete expression: '{last_line}'")
 
     # Check for incomplete function/class definitions
@@ -963,12 +974,12 @@ def detect_incomplete_file(content: str, file_path: Path) -> List[str]:
         issues.append("TRUNCATED: Unclosed triple-quoted string (''')")
 
     # Check if __all__ exports reference missing definitions
-    all_match = re.search(r"__all__\s*=\s*\[([^\]]+)\]", content)
+    all_match = _DUNDER_ALL_RE.search(content)
     if all_match:
-        exports = re.findall(r"['\"]([a-zA-Z_][a-zA-Z0-9_]*)['\"]", all_match.group(1))
+        exports = _QUOTED_NAME_RE.findall(all_match.group(1))
         # Get defined classes and functions
-        defined_classes = set(re.findall(r'^class\s+([A-Za-z_][A-Za-z0-9_]*)', content, re.MULTILINE))
-        defined_functions = set(re.findall(r'^def\s+([A-Za-z_][A-Za-z0-9_]*)', content, re.MULTILINE))
+        defined_classes = set(_CLASS_DEF_RE.findall(content))
+        defined_functions = set(_FUNCTION_DEF_RE.findall(content))
         defined_all = defined_classes | defined_functions
 
         missing = [e for e in exports if e not in defined_all]
@@ -1127,7 +1138,8 @@ def integrate_file(
     source: Path,
     target: Path,
     dry_run: bool = False,
-    fail_on_truncation: bool = True
+    fail_on_truncation: bool = True,
+    content: Optional[str] = None
 ) -> bool:
     """
     Integrate a single file.
@@ -1137,6 +1149,7 @@ def integrate_file(
         target: Target file path
         dry_run: If True, only preview without modifying files
         fail_on_truncation: If True, refuse to integrate truncated files (default: True)
+        content: Source text already read by the caller; read from source if None
 
     Returns:
         True if integration succeeded, False otherwise
@@ -1148,12 +1161,13 @@ def integrate_file(
         return True
 
     # Read source file and clean it BEFORE creating backup
-    try:
-        with open(source, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except Exception as e:
-        print(f"  ✗ Failed to read {source.name}: {e}")
-        return False
+    if content is None:
+        try:
+            with open(source, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except Exception as e:
+            print(f"  ✗ Failed to read {source.name}: {e}")
+            return False
 
     # Clean markdown code blocks for Python files
     if source.suffix == '.py':
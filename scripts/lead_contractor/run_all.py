@@ -90,11 +90,11 @@ def main():
     if args.group:
         features = FEATURE_GROUPS[args.group]
     elif args.python_only:
-        features = GRAPH_FEATURES + LEARNING_FEATURES
+        features = [*GRAPH_FEATURES, *LEARNING_FEATURES]
     elif args.typescript_only:
         features = VSCODE_FEATURES
     else:
-        features = GRAPH_FEATURES + LEARNING_FEATURES + VSCODE_FEATURES
+        features = [*GRAPH_FEATURES, *LEARNING_FEATURES, *VSCODE_FEATURES]
 
     print("=" * 60)
     print("Phase 3 Strategic - Lead Contractor Workflow")
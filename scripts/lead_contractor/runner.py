@@ -2,12 +2,14 @@
 Workflow runner utilities for Lead Contractor.
 """
 
+import functools
+import hashlib
 import json
 import re
 import traceback
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 
 from opentelemetry import trace
 
@@ -24,14 +26,28 @@ from .config import (
 )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Feature:
-    """A feature to be implemented by the Lead Contractor workflow."""
-    task: str
+    """A feature to be implemented by the Lead Contractor workflow.
+
+    ``task`` is either the prompt text itself or a zero-argument loader
+    (see ``tasks.prompt_loader.lazy_prompt``) that is only called when the
+    feature actually runs.
+    """
+    task: Union[str, Callable[[], str]]
     name: str
     is_typescript: bool = False
     output_subdir: Optional[str] = None
 
+    @property
+    def task_text(self) -> str:
+        return self.task() if callable(self.task) else self.task
+
+    @property
+    def task_hash(self) -> bytes:
+        """128-bit BLAKE2b digest of the task text, identifying the prompt in saved results."""
+        return _task_digest(self.task_text)
+
     @property
     def context(self) -> Dict[str, str]:
         return TYPESCRIPT_CONTEXT if self.is_typescript else PYTHON_CONTEXT
@@ -45,6 +61,14 @@ class Feature:
         return ".ts" if self.is_typescript else ".py"
 
 
+@functools.cache
+def _task_digest(text: str) -> bytes:
+    # Keyed on the prompt string itself: lazy prompts come back as the same
+    # cached object, so repeat lookups reuse its stored hash instead of
+    # rehashing the whole text with BLAKE2b.
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
 # OpenTelemetry tracer for cost tracking (BLC-009)
 tracer = trace.get_tracer("contextcore.lead_contractor")
 
@@ -106,7 +130,7 @@ def run_workflow(feature: Feature, verbose: bool = True) -> WorkflowResult:
         workflow = LeadContractorWorkflow()
 
         config = {
-            "task_description": feature.task,
+            "task_description": feature.task_text,
             "context": feature.context,
             "lead_agent": LEAD_AGENT,
             "drafter_agent": DRAFTER_AGENT,
@@ -185,6 +209,9 @@ def get_result_file_path(feature: Feature, output_dir: Optional[Path] = None) ->
 def load_existing_result(feature: Feature, output_dir: Optional[Path] = None) -> Optional[WorkflowResult]:
     """
     Load an existing successful result for a feature if it exists.
+
+    Results saved with a ``task_hash`` are only reused while the feature's
+    prompt still hashes the same; older results without one are reused as-is.
     
     Returns:
         WorkflowResult if found and successful, None otherwise
@@ -198,6 +225,11 @@ def load_existing_result(feature: Feature, output_dir: Optional[Path] = None) ->
         with open(result_file, "r") as f:
             data = json.load(f)
         
+        # A changed prompt invalidates the saved result
+        saved_hash = data.get("task_hash")
+        if saved_hash is not None and saved_hash != feature.task_hash.hex():
+            return None
+
         # Only return if it was successful
         if data.get("success", False):
             return WorkflowResult(
@@ -241,6 +273,7 @@ def save_result(result: WorkflowResult, feature: Feature, output_dir: Optional[P
             "input_tokens": result.input_tokens,
             "output_tokens": result.output_tokens,
             "model": result.model,
+            "task_hash": feature.task_hash.hex(),
         }, f, indent=2)
 
     # Save implementation code
@@ -257,7 +290,7 @@ def save_result(result: WorkflowResult, feature: Feature, output_dir: Optional[P
 
 
 def run_features(
-    features: List[Feature],
+    features: Sequence[Feature],
     output_dir: Optional[Path] = None,
     verbose: bool = True,
     stop_on_error: bool = False,
@@ -268,7 +301,7 @@ def run_features(
     Run Lead Contractor workflow for multiple features.
 
     Args:
-        features: List of features to implement
+        features: Features to implement (list or tuple)
         output_dir: Output directory for generated code
         verbose: Whether to print progress
         stop_on_error: Whether to stop on first error
@@ -21,66 +21,75 @@ and ContextCore observability types (trace references, log queries, etc.).
 
 ## Requirements
 
-1. Create PartType enum with all supported types:
+1. Create PartType as a plain class of `Final` string constants, NOT an Enum.
+   Part types are compared on every serialize/validate call; plain class
+   attributes avoid the EnumMeta descriptor lookup, and values stay ordinary
+   (interned) strings on the wire:
    ```python
-   class PartType(str, Enum):
+   class PartType:
+       '''Part type discriminators (plain string constants).'''
        # A2A-compatible types
-       TEXT = "text"
-       FILE = "file"
-       DATA = "data"
-       JSON = "json"
-       FORM = "form"
-       IFRAME = "iframe"
-       VIDEO = "video"
-       AUDIO = "audio"
-       ACTION = "action"
+       TEXT: Final = "text"
+       FILE: Final = "file"
+       DATA: Final = "data"
+       JSON: Final = "json"
+       FORM: Final = "form"
+       IFRAME: Final = "iframe"
+       VIDEO: Final = "video"
+       AUDIO: Final = "audio"
+       ACTION: Final = "action"
        # ContextCore observability types
-       TRACE = "trace"
-       SPAN = "span"
-       LOG_QUERY = "log_query"
-       METRIC_QUERY = "metric_query"
+       TRACE: Final = "trace"
+       SPAN: Final = "span"
+       LOG_QUERY: Final = "log_query"
+       METRIC_QUERY: Final = "metric_query"
        # ContextCore artifact types
-       COMMIT = "commit"
-       PR = "pr"
-       ADR = "adr"
-       DOC = "doc"
-       CAPABILITY = "capability"
-       INSIGHT = "insight"
-       TASK = "task"
+       COMMIT: Final = "commit"
+       PR: Final = "pr"
+       ADR: Final = "adr"
+       DOC: Final = "doc"
+       CAPABILITY: Final = "capability"
+       INSIGHT: Final = "insight"
+       TASK: Final = "task"
+
+   PART_TYPE_VALUES: frozenset[str] = frozenset(
+       value for name, value in vars(PartType).items() if name.isupper()
+   )
    ```
-
-2. Create Part dataclass with all possible fields:
+   - Membership checks use `t in PART_TYPE_VALUES`; never construct `PartType(t)`
+   - from_dict/from_a2a_dict raise ValueError for a type not in PART_TYPE_VALUES
+
+2. Create Part dataclass with all possible fields. Use
+   `@dataclass(slots=True, kw_only=True, weakref_slot=True)` (the weakref
+   slot is needed by Part.intern below): a conversation can carry thousands
+   of Parts, and with ~15 optional fields a per-instance `__dict__` dominates
+   memory; slots also make `part.type` / `part.text` reads cheaper:
    ```python
-   @dataclass
+   @dataclass(slots=True, kw_only=True, weakref_slot=True)
    class Part:
        '''Unified content part (A2A-compatible with ContextCore extensions).'''
-       type: PartType
-
-       # Text content (TEXT type)
-       text: str | None = None
-
-       # File content (FILE type)
-       file_uri: str | None = None
-       mime_type: str | None = None
+       # Field order is deliberate: slots are laid out in declaration order,
+       # so the discriminator and the fields read by to_a2a_dict/_validate
+       # come first and rarely-read fields last.
+       type: str  # one of the PartType constants
+
+       # Hot: A2A payload fields
+       text: str | None = None                # TEXT
+       data: dict[str, Any] | None = None     # DATA, JSON, FORM
+       file_uri: str | None = None            # FILE
+       mime_type: str | None = None           # FILE
+
+       # Warm: ContextCore references and observability
+       ref: str | None = None                 # COMMIT, PR, ADR, DOC, CAPABILITY, INSIGHT, TASK
+       trace_id: str | None = None            # TRACE, SPAN
+       query: str | None = None               # LOG_QUERY, METRIC_QUERY (TraceQL, LogQL, PromQL)
+       span_id: str | None = None             # SPAN
+
+       # Cold: descriptive extras
        file_name: str | None = None
-
-       # Structured data (DATA, JSON, FORM types)
-       data: dict[str, Any] | None = None
-
-       # ContextCore observability (TRACE, SPAN, LOG_QUERY, METRIC_QUERY)
-       trace_id: str | None = None
-       span_id: str | None = None
-       query: str | None = None  # TraceQL, LogQL, PromQL
-
-       # Reference (COMMIT, PR, ADR, DOC, CAPABILITY, INSIGHT, TASK)
-       ref: str | None = None
        ref_url: str | None = None
        description: str | None = None
-
-       # Token budget (ContextCore extension)
-       tokens: int | None = None
-
-       # Timestamp
+       tokens: int | None = None              # Token budget (ContextCore extension)
        timestamp: datetime | None = None
 
        # Validation
@@ -89,38 +98,120 @@ and ContextCore observability types (trace references, log queries, etc.).
 
        def _validate(self):
            '''Validate that required fields are present for the part type.'''
-           ...
+           for name in _REQUIRED_FIELDS.get(self.type, ()):
+               if getattr(self, name) is None:
+                   raise ValueError(f"Part of type {self.type!r} requires {name!r}")
+   ```
+   Validation is table-driven, not a per-type if/elif chain. Every Part
+   construction runs it, so the per-type rules live in one module-level dict:
+   ```python
+   _REQUIRED_FIELDS: dict[str, tuple[str, ...]] = {
+       PartType.TEXT: ("text",),
+       PartType.FILE: ("file_uri", "mime_type"),
+       PartType.DATA: ("data",),
+       PartType.JSON: ("data",),
+       PartType.TRACE: ("trace_id",),
+       PartType.SPAN: ("trace_id", "span_id"),
+       PartType.LOG_QUERY: ("query",),
+       PartType.METRIC_QUERY: ("query",),
+       PartType.COMMIT: ("ref",),
+       # ... remaining types
+   }
    ```
 
-3. Implement conversion methods:
+3. Implement conversion methods with table dispatch, not if/elif chains.
+   Every handoff step serializes many Parts, so to_a2a_dict must be a single
+   dict lookup plus one small function call. The schema is fixed at import
+   time, so define one module-level function per A2A type, each doing direct
+   attribute reads only:
    ```python
+   def _ser_text(p: "Part") -> dict:
+       return {"text": p.text}
+
+   def _ser_file(p: "Part") -> dict:
+       return {"fileUri": p.file_uri, "mimeType": p.mime_type}
+
+   def _ser_json(p: "Part") -> dict:
+       return {"json": p.data}
+
+   def _ser_extension(p: "Part") -> dict:
+       # CC extension types - represent as data
+       return {"json": p.to_dict()}
+
+   # Keyed on the PartType constant; types not listed use _ser_extension.
+   _A2A_SERIALIZERS: dict[str, Callable[["Part"], dict]] = {
+       PartType.TEXT: _ser_text,
+       PartType.FILE: _ser_file,
+       PartType.DATA: _ser_json,
+       PartType.JSON: _ser_json,
+       # ... other A2A types
+   }
+
+   # Keyed on the discriminator key A2A puts in the part dict.
+   _A2A_DESERIALIZERS: dict[str, Callable[[dict], "Part"]] = {
+       "text": lambda d: Part(type=PartType.TEXT, text=d["text"]),
+       "fileUri": lambda d: Part(
+           type=PartType.FILE, file_uri=d["fileUri"], mime_type=d.get("mimeType")
+       ),
+       "json": lambda d: Part(type=PartType.JSON, data=d["json"]),
+       # ... other A2A types
+   }
+
    def to_a2a_dict(self) -> dict:
        '''Convert to A2A Part format (only A2A-compatible fields).'''
-       if self.type == PartType.TEXT:
-           return {"text": self.text}
-       elif self.type == PartType.FILE:
-           return {"fileUri": self.file_uri, "mimeType": self.mime_type}
-       elif self.type in (PartType.DATA, PartType.JSON):
-           return {"json": self.data}
-       # ... handle other types
-       else:
-           # CC extension types - represent as data
-           return {"json": self.to_dict()}
+       return _A2A_SERIALIZERS.get(self.type, _ser_extension)(self)
 
    def to_dict(self) -> dict:
        '''Convert to full dict representation.'''
        ...
 
    @classmethod
-   def from_dict(cls, data: dict) -> "Part":
-       '''Parse from dict (handles both A2A and CC formats).'''
+   def from_dict(cls, data: dict, *, trusted: bool = False) -> "Part":
+       '''Parse from dict (handles both A2A and CC formats).
+
+       trusted=True is for data this process wrote via to_dict() (e.g.
+       replaying persisted handoff logs) and builds through _unchecked.
+       '''
        ...
 
+   @classmethod
+   def _unchecked(cls, **fields) -> "Part":
+       '''Build without __post_init__ (no validation). Trusted input only.'''
+       obj = object.__new__(cls)
+       for name, default in _FIELD_DEFAULTS.items():
+           setattr(obj, name, fields.get(name, default))
+       return obj
+
    @classmethod
    def from_a2a_dict(cls, data: dict) -> "Part":
        '''Parse from A2A Part format.'''
+       # Find the first known discriminator key in data and dispatch on it;
+       # raise ValueError if none is present.
        ...
    ```
+   - Adding a new A2A type means adding one function and one table entry
+   - `_FIELD_DEFAULTS: dict[str, Any]` is built once after the class from
+     `dataclasses.fields(Part)`; every slot must be assigned, since an unset
+     slot raises AttributeError on read
+   - from_a2a_dict always validates: its input comes from remote agents
+
+   Add module-level batch helpers for list-valued fields (Message.parts,
+   Artifact.parts). They hoist the table and fallback into locals once per
+   list instead of resolving them per element:
+   ```python
+   def dump_parts(parts: Iterable["Part"]) -> list[dict]:
+       '''A2A dicts for many parts (same output as per-part to_a2a_dict).'''
+       get = _A2A_SERIALIZERS.get
+       fallback = _ser_extension
+       return [get(p.type, fallback)(p) for p in parts]
+
+   def load_parts(items: Iterable[dict]) -> list["Part"]:
+       '''Parse many A2A part dicts (validated, like from_a2a_dict).'''
+       from_a2a = Part.from_a2a_dict
+       return [from_a2a(d) for d in items]
+   ```
+   - Do not generate these functions with exec(); plain functions are just as
+     fast and stay readable and debuggable
 
 4. Implement factory methods:
    ```python
@@ -138,7 +229,7 @@ and ContextCore observability types (trace references, log queries, etc.).
 
    @classmethod
    def trace(cls, trace_id: str, description: str = None) -> "Part":
-       return cls(type=PartType.TRACE, trace_id=trace_id, description=description)
+       return cls.intern(type=PartType.TRACE, trace_id=trace_id, description=description)
 
    @classmethod
    def log_query(cls, query: str, description: str = None) -> "Part":
@@ -146,14 +237,70 @@ and ContextCore observability types (trace references, log queries, etc.).
 
    @classmethod
    def commit(cls, sha: str, description: str = None, url: str = None) -> "Part":
-       return cls(type=PartType.COMMIT, ref=sha, description=description, ref_url=url)
+       return cls.intern(type=PartType.COMMIT, ref=sha, description=description, ref_url=url)
 
    @classmethod
    def adr(cls, ref: str, description: str = None, url: str = None) -> "Part":
-       return cls(type=PartType.ADR, ref=ref, description=description, ref_url=url)
+       return cls.intern(type=PartType.ADR, ref=ref, description=description, ref_url=url)
+
+   @classmethod
+   def intern(cls, **fields) -> "Part":
+       '''Return a shared Part for identical reference fields.
+
+       Workflows cite the same commit/ADR/trace across many messages; this
+       returns one instance per distinct field set while any holder keeps
+       it alive. Interned parts are shared and must not be mutated.
+       '''
+       key = (cls, tuple(sorted(fields.items())))
+       part = _INTERNED.get(key)
+       if part is None:
+           part = cls(**fields)
+           _INTERNED[key] = part
+       return part
+   ```
+   - `_INTERNED: weakref.WeakValueDictionary[tuple, Part]` is module-level;
+     entries disappear once no message references the part
+   - Only the reference factories (trace, commit, adr) intern; text, file
+     and json_data parts are usually unique or carry mutable payloads
+
+5. Also create src/contextcore/models/_ids.py, the shared ID generator used
+   by Message, Artifact and InputRequest. IDs are correlation handles, not
+   secrets, so seed one counter from os.urandom at import time instead of
+   building a uuid4 (one urandom read plus a UUID object) per instance:
+   ```python
+   import itertools
+   import os
+
+   _counter = itertools.count(int.from_bytes(os.urandom(6), "big"))
+
+   def next_id(prefix: str) -> str:
+       '''Return a process-unique ID such as "msg-00a1b2c3d4e5".'''
+       return f"{prefix}-{next(_counter) & 0xFFFFFFFFFFFF:012x}"
+   ```
+
+6. Add wire serialization. Create src/contextcore/models/_json.py with a
+   `dumps` shim that prefers orjson (optional dependency) and falls back to
+   the stdlib, the same shape as the discovery endpoint's `_dumps`:
+   ```python
+   try:
+       import orjson
+
+       def dumps(payload: Any) -> bytes:
+           return orjson.dumps(payload, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
+   except ImportError:
+       import json
+
+       def dumps(payload: Any) -> bytes:
+           return json.dumps(payload, default=str).encode("utf-8")
+   ```
+   Then on Part:
+   ```python
+   def to_a2a_bytes(self) -> bytes:
+       '''Serialize straight to A2A JSON bytes (no caller-side json.dumps).'''
+       return dumps(self.to_a2a_dict())
    ```
 
-5. Implement Evidence compatibility:
+7. Implement Evidence compatibility:
    ```python
    def to_evidence(self) -> "Evidence":
        '''Convert to legacy Evidence format for backward compatibility.'''
@@ -195,32 +342,88 @@ ContextCore extensions for agent attribution and metadata.
 
 ## Requirements
 
-1. Create MessageRole enum:
+1. Create MessageRole as a plain class of `Final` string constants (not an
+   Enum, same reasoning as PartType in part.py):
    ```python
-   class MessageRole(str, Enum):
-       USER = "user"      # Client/caller
-       AGENT = "agent"    # Remote agent
-       SYSTEM = "system"  # System-generated (CC extension)
+   class MessageRole:
+       USER: Final = "user"      # Client/caller
+       AGENT: Final = "agent"    # Remote agent
+       SYSTEM: Final = "system"  # System-generated (CC extension)
+
+   MESSAGE_ROLE_VALUES: frozenset[str] = frozenset({"user", "agent", "system"})
    ```
 
-2. Create Message dataclass:
+2. Create Message dataclass (`slots=True, kw_only=True`, same as Part):
    ```python
-   @dataclass
+   @dataclass(slots=True, kw_only=True)
    class Message:
        '''A2A-compatible message with ContextCore extensions.'''
        message_id: str
-       role: MessageRole
-       parts: list[Part]
-       timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+       role: str  # one of the MessageRole constants
+       parts: tuple[Part, ...]  # immutable once built
+       timestamp: datetime = field(default_factory=utc_now)
        # ContextCore extensions
        agent_id: str | None = None
        session_id: str | None = None
-       metadata: dict[str, Any] = field(default_factory=dict)
+       metadata: Mapping[str, Any] = _EMPTY_META
 
        def __post_init__(self):
            if not self.message_id:
-               self.message_id = f"msg-{uuid.uuid4().hex[:12]}"
+               self.message_id = next_id("msg")
+
+       def set_metadata(self, key: str, value: Any) -> None:
+           '''Set one metadata entry, allocating the dict on first write.'''
+           if self.metadata is _EMPTY_META:
+               self.metadata = {}
+           self.metadata[key] = value
+   ```
+   Most messages never carry metadata, so they share one read-only empty
+   mapping instead of allocating a dict each:
+   ```python
+   _EMPTY_META: Mapping[str, Any] = MappingProxyType({})
+   ```
+   - Callers write through set_metadata(), never `msg.metadata[k] = v`
+   - to_dict() emits `dict(self.metadata)`
+
+   Create the timestamp helper at src/contextcore/models/_clock.py, shared with
+   Artifact and InputRequest. Bulk construction (e.g. replaying a handoff
+   history) creates many objects per millisecond; reuse one datetime per
+   1ms tick instead of building a new one for each:
+   ```python
+   import contextvars
+   import time
+   from contextlib import contextmanager
+   from datetime import datetime, timezone
+
+   _RESOLUTION_NS = 1_000_000  # 1ms
+   _precise: contextvars.ContextVar[bool] = contextvars.ContextVar(
+       "contextcore_precise_clock", default=False
+   )
+   _last_ns = 0
+   _cached = datetime.now(timezone.utc)
+
+   def utc_now() -> datetime:
+       '''Current UTC time, coalesced to _RESOLUTION_NS unless precise.'''
+       global _last_ns, _cached
+       if _precise.get():
+           return datetime.now(timezone.utc)
+       now_ns = time.monotonic_ns()
+       if now_ns - _last_ns >= _RESOLUTION_NS:
+           _cached = datetime.now(timezone.utc)
+           _last_ns = now_ns
+       return _cached
+
+   @contextmanager
+   def ClockContext(precise: bool = True):
+       '''Within this block utc_now() returns exact, uncoalesced times.'''
+       token = _precise.set(precise)
+       try:
+           yield
+       finally:
+           _precise.reset(token)
    ```
+   - Callers that need strictly distinct or exact timestamps wrap the work
+     in `with ClockContext(precise=True):`
 
 3. Implement A2A conversion:
    ```python
@@ -228,11 +431,15 @@ ContextCore extensions for agent attribution and metadata.
        '''Convert to A2A Message format.'''
        return {
            "messageId": self.message_id,
-           "role": self.role.value,
-           "parts": [p.to_a2a_dict() for p in self.parts],
+           "role": self.role,
+           "parts": dump_parts(self.parts),
            "timestamp": self.timestamp.isoformat(),
        }
 
+   def to_a2a_bytes(self) -> bytes:
+       '''Serialize to A2A JSON bytes via contextcore.models._json.dumps.'''
+       return dumps(self.to_a2a_dict())
+
    def to_dict(self) -> dict:
        '''Convert to full dict with CC extensions.'''
        ...
@@ -243,26 +450,30 @@ ContextCore extensions for agent attribution and metadata.
        ...
 
    @classmethod
-   def from_dict(cls, data: dict) -> "Message":
+   def from_dict(cls, data: dict, *, trusted: bool = False) -> "Message":
        '''Parse from dict (handles both formats).'''
        ...
    ```
+   - Add the same `_unchecked(**fields)` classmethod as Part (skips
+     __post_init__, so no ID/timestamp minting). `trusted=True` builds the
+     message and its parts via `_unchecked`, for replaying data written by
+     to_dict(); the default path validates as usual
 
 4. Implement factory methods:
    ```python
    @classmethod
-   def from_text(cls, text: str, role: MessageRole = MessageRole.USER, **kwargs) -> "Message":
+   def from_text(cls, text: str, role: str = MessageRole.USER, **kwargs) -> "Message":
        '''Create message from plain text.'''
        return cls(
-           message_id=f"msg-{uuid.uuid4().hex[:12]}",
+           message_id=next_id("msg"),
            role=role,
-           parts=[Part.text(text)],
+           parts=(Part.text(text),),
            **kwargs
        )
 
    @classmethod
-   def from_parts(cls, parts: list[Part], role: MessageRole = MessageRole.USER, **kwargs) -> "Message":
-       '''Create message from parts.'''
+   def from_parts(cls, parts: Iterable[Part], role: str = MessageRole.USER, **kwargs) -> "Message":
+       '''Create message from parts (stored as a tuple).'''
        ...
 
    @classmethod
@@ -280,17 +491,27 @@ ContextCore extensions for agent attribution and metadata.
    ```python
    def get_text_content(self) -> str:
        '''Extract all text content from parts.'''
-       return " ".join(p.text for p in self.parts if p.type == PartType.TEXT and p.text)
+       text = PartType.TEXT
+       texts = [p.text for p in self.parts if p.type == text and p.text]
+       return " ".join(texts) if texts else ""
 
    def get_files(self) -> list[Part]:
        '''Get all file parts.'''
-       return [p for p in self.parts if p.type == PartType.FILE]
+       file = PartType.FILE
+       return [p for p in self.parts if p.type == file]
 
    def add_part(self, part: Part) -> "Message":
-       '''Add a part and return self for chaining.'''
-       self.parts.append(part)
-       return self
+       '''Return a copy of this message with part appended.'''
+       return dataclasses.replace(self, parts=(*self.parts, part))
    ```
+   - Messages are built then sent, so `parts` is a tuple: from_text,
+     from_parts and from_a2a_dict/from_dict build `tuple(...)`, and built
+     messages can be shared across threads without copying
+   - add_part is copy-on-write and no longer mutates the receiver
+   - Bind the PartType constant to a local before the comprehension, and
+     join a list rather than a generator (str.join materializes it anyway)
+   - Keep `==`, not `is`: types parsed from JSON are not guaranteed to be
+     interned, and str equality already short-circuits on identity
 
 ## Output Format
 Provide clean Python code with:
@@ -315,9 +536,9 @@ during handoff execution, with ContextCore extensions for OTel linking.
 
 ## Requirements
 
-1. Create Artifact dataclass:
+1. Create Artifact dataclass (`slots=True, kw_only=True`, same as Part):
    ```python
-   @dataclass
+   @dataclass(slots=True, kw_only=True)
    class Artifact:
        '''A2A-compatible artifact with ContextCore extensions.'''
        artifact_id: str
@@ -331,13 +552,20 @@ during handoff execution, with ContextCore extensions for OTel linking.
        trace_id: str | None = None  # Link to OTel trace
        name: str | None = None  # Human-readable name
        description: str | None = None
-       metadata: dict[str, Any] = field(default_factory=dict)
-       created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+       metadata: Mapping[str, Any] = _EMPTY_META
+       created_at: datetime = field(default_factory=utc_now)
 
        def __post_init__(self):
            if not self.artifact_id:
-               self.artifact_id = f"artifact-{uuid.uuid4().hex[:12]}"
+               self.artifact_id = next_id("artifact")
+
+       def set_metadata(self, key: str, value: Any) -> None:
+           '''Set one metadata entry, allocating the dict on first write.'''
+           if self.metadata is _EMPTY_META:
+               self.metadata = {}
+           self.metadata[key] = value
    ```
+   `_EMPTY_META` is the same shared `MappingProxyType({})` default as Message.
 
 2. Implement A2A conversion:
    ```python
@@ -345,13 +573,17 @@ during handoff execution, with ContextCore extensions for OTel linking.
        '''Convert to A2A Artifact format.'''
        return {
            "artifactId": self.artifact_id,
-           "parts": [p.to_a2a_dict() for p in self.parts],
+           "parts": dump_parts(self.parts),
            "mediaType": self.media_type,
            "index": self.index,
            "append": self.append,
            "lastChunk": self.last_chunk,
        }
 
+   def to_a2a_bytes(self) -> bytes:
+       '''Serialize to A2A JSON bytes via contextcore.models._json.dumps.'''
+       return dumps(self.to_a2a_dict())
+
    def to_dict(self) -> dict:
        '''Convert to full dict with CC extensions.'''
        ...
@@ -360,7 +592,13 @@ during handoff execution, with ContextCore extensions for OTel linking.
    def from_a2a_dict(cls, data: dict) -> "Artifact":
        '''Parse from A2A Artifact format.'''
        ...
+
+   @classmethod
+   def from_dict(cls, data: dict, *, trusted: bool = False) -> "Artifact":
+       '''Parse from full dict; trusted=True builds via _unchecked.'''
+       ...
    ```
+   - Add the same `_unchecked(**fields)` classmethod as Part and Message
 
 3. Implement factory methods:
    ```python
@@ -368,7 +606,7 @@ during handoff execution, with ContextCore extensions for OTel linking.
    def from_json(cls, data: dict, artifact_id: str = None, name: str = None) -> "Artifact":
        '''Create artifact from JSON data.'''
        return cls(
-           artifact_id=artifact_id or f"artifact-{uuid.uuid4().hex[:12]}",
+           artifact_id=artifact_id or next_id("artifact"),
            parts=[Part.json_data(data)],
            media_type="application/json",
            name=name,
@@ -378,7 +616,7 @@ during handoff execution, with ContextCore extensions for OTel linking.
    def from_text(cls, text: str, artifact_id: str = None, name: str = None) -> "Artifact":
        '''Create artifact from text.'''
        return cls(
-           artifact_id=artifact_id or f"artifact-{uuid.uuid4().hex[:12]}",
+           artifact_id=artifact_id or next_id("artifact"),
            parts=[Part.text(text)],
            media_type="text/plain",
            name=name,
@@ -388,7 +626,7 @@ during handoff execution, with ContextCore extensions for OTel linking.
    def from_file(cls, uri: str, mime_type: str, artifact_id: str = None, name: str = None) -> "Artifact":
        '''Create artifact from file reference.'''
        return cls(
-           artifact_id=artifact_id or f"artifact-{uuid.uuid4().hex[:12]}",
+           artifact_id=artifact_id or next_id("artifact"),
            parts=[Part.file(uri, mime_type)],
            media_type=mime_type,
            name=name,
@@ -459,15 +697,47 @@ backward compatibility with the legacy Evidence class.
 
 1. Import and re-export all model classes:
    ```python
-   from .part import Part, PartType
-   from .message import Message, MessageRole
+   from .part import Part, PartType, PART_TYPE_VALUES
+   from .message import Message, MessageRole, MESSAGE_ROLE_VALUES
    from .artifact import Artifact
    ```
 
 2. Create Evidence alias for backward compatibility:
    ```python
+   import os
    import warnings
 
+   # Built once at import; legacy Evidence construction is a hot path during
+   # migration and must not rebuild this per call.
+   _EVIDENCE_TYPE_MAP: dict[str, str] = {
+       "trace": PartType.TRACE,
+       "log_query": PartType.LOG_QUERY,
+       "metric_query": PartType.METRIC_QUERY,
+       "file": PartType.FILE,
+       "commit": PartType.COMMIT,
+       "pr": PartType.PR,
+       "adr": PartType.ADR,
+       "doc": PartType.DOC,
+       "task": PartType.TASK,
+       "capability": PartType.CAPABILITY,
+   }
+
+   # Legacy loops can build thousands of Evidence objects; warnings.warn
+   # walks the filter list and stack each time. Warn at most once per
+   # process, and only when CONTEXTCORE_WARN_LEGACY is set.
+   _warned_legacy = False
+
+   def _warn_legacy_once() -> None:
+       global _warned_legacy
+       if _warned_legacy or not os.environ.get("CONTEXTCORE_WARN_LEGACY"):
+           return
+       _warned_legacy = True
+       warnings.warn(
+           "Evidence is deprecated, use Part instead",
+           DeprecationWarning,
+           stacklevel=3,
+       )
+
    def _create_evidence_alias():
        '''Create Evidence as deprecated alias for Part.'''
 
@@ -477,12 +747,13 @@ backward compatibility with the legacy Evidence class.
 
            This class is maintained for backward compatibility.
            '''
+           # Part is slotted; an empty __slots__ keeps Evidence instances
+           # from growing a __dict__. Not re-decorated with @dataclass, which
+           # would replace the custom positional __init__ below.
+           __slots__ = ()
+
            def __init__(self, type: str, ref: str, description: str = None, query: str = None, timestamp = None):
-               warnings.warn(
-                   "Evidence is deprecated, use Part instead",
-                   DeprecationWarning,
-                   stacklevel=2
-               )
+               _warn_legacy_once()
                # Map old Evidence fields to Part
                part_type = self._map_evidence_type(type)
                super().__init__(
@@ -494,21 +765,9 @@ backward compatibility with the legacy Evidence class.
                )
 
            @staticmethod
-           def _map_evidence_type(evidence_type: str) -> PartType:
+           def _map_evidence_type(evidence_type: str) -> str:
                '''Map legacy Evidence type strings to PartType.'''
-               mapping = {
-                   "trace": PartType.TRACE,
-                   "log_query": PartType.LOG_QUERY,
-                   "metric_query": PartType.METRIC_QUERY,
-                   "file": PartType.FILE,
-                   "commit": PartType.COMMIT,
-                   "pr": PartType.PR,
-                   "adr": PartType.ADR,
-                   "doc": PartType.DOC,
-                   "task": PartType.TASK,
-                   "capability": PartType.CAPABILITY,
-               }
-               return mapping.get(evidence_type, PartType.DATA)
+               return _EVIDENCE_TYPE_MAP.get(evidence_type, PartType.DATA)
 
        return Evidence
 
@@ -554,9 +813,11 @@ backward compatibility with the legacy Evidence class.
        # Part model
        "Part",
        "PartType",
+       "PART_TYPE_VALUES",
        # Message model
        "Message",
        "MessageRole",
+       "MESSAGE_ROLE_VALUES",
        # Artifact model
        "Artifact",
        # Backward compatibility
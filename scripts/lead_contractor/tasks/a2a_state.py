@@ -36,11 +36,18 @@ along with helper methods for state management and transition validation.
        CANCELLED = "cancelled"
        REJECTED = "rejected"
    ```
+   HandoffStatus stays a `str` Enum: it is existing public API (`.value`,
+   `HandoffStatus("pending")`) and requirement 7 demands backward
+   compatibility. Hot-path membership checks must not rebuild sets per call;
+   use module-level frozensets of members instead.
 
 2. Add class methods to HandoffStatus:
    - is_terminal() -> bool: Returns True for COMPLETED, FAILED, TIMEOUT, CANCELLED, REJECTED
    - is_active() -> bool: Returns True for PENDING, ACCEPTED, IN_PROGRESS, INPUT_REQUIRED
    - can_accept_messages() -> bool: Returns True if handoff can receive new messages
+   - Implement these against precomputed bitmasks (see requirement 5), e.g.
+     `return bool((_TERMINAL_MASK >> _STATUS_INDEX[self]) & 1)`, not by
+     building a set literal per call
 
 3. Create StateTransition dataclass for tracking transitions:
    ```python
@@ -59,10 +66,58 @@ along with helper methods for state management and transition validation.
    - IN_PROGRESS → INPUT_REQUIRED, COMPLETED, FAILED, CANCELLED
    - INPUT_REQUIRED → IN_PROGRESS, COMPLETED, FAILED, CANCELLED
 
-5. Add validate_transition(from_status, to_status) -> bool function
+5. Add validate_transition(from_status, to_status) -> bool function.
+   VALID_TRANSITIONS stays the readable source of truth; derive an integer
+   bitmask table from it once at import so each check is two small-dict
+   lookups and a shift instead of a set lookup:
+   ```python
+   _STATUS_INDEX: dict[HandoffStatus, int] = {s: i for i, s in enumerate(HandoffStatus)}
+
+   def _mask(statuses) -> int:
+       return sum(1 << _STATUS_INDEX[s] for s in statuses)
+
+   # _TRANSITION_BITS[i] has bit j set when status i may move to status j.
+   _TRANSITION_BITS: tuple[int, ...] = tuple(
+       _mask(VALID_TRANSITIONS.get(s, ())) for s in HandoffStatus
+   )
+   _TERMINAL_MASK = _mask({COMPLETED, FAILED, TIMEOUT, CANCELLED, REJECTED})
+   _ACTIVE_MASK = _mask({PENDING, ACCEPTED, IN_PROGRESS, INPUT_REQUIRED})
+
+   def validate_transition(from_status: HandoffStatus, to_status: HandoffStatus) -> bool:
+       return bool((_TRANSITION_BITS[_STATUS_INDEX[from_status]] >> _STATUS_INDEX[to_status]) & 1)
+   ```
+   (write the mask sets with fully qualified `HandoffStatus.X` members)
 
-6. Update Handoff dataclass to track transition history:
-   - Add field: transitions: list[StateTransition] = field(default_factory=list)
+6. Update Handoff dataclass to track transition history as a bounded ring
+   buffer of compact tuples (chatty handoffs would otherwise grow an
+   unbounded list of dataclasses each holding a datetime):
+   ```python
+   _MAX_TRANSITIONS = 128
+
+   # (from_idx, to_idx, timestamp_ns, reason, triggered_by); indices are
+   # _STATUS_INDEX positions, reason strings are sys.intern()ed
+   TransitionRecord = tuple[int, int, int, str | None, str | None]
+
+   transitions: deque[TransitionRecord] = field(
+       default_factory=lambda: deque(maxlen=_MAX_TRANSITIONS)
+   )
+
+   def record_transition(self, from_status, to_status, reason=None, triggered_by=None) -> None:
+       self.transitions.append((
+           _STATUS_INDEX[from_status],
+           _STATUS_INDEX[to_status],
+           time.time_ns(),
+           sys.intern(reason) if reason else None,
+           triggered_by,
+       ))
+
+   def iter_transitions(self) -> Iterator[StateTransition]:
+       '''Materialize StateTransition objects on demand, oldest first.'''
+       ...
+   ```
+   - Build `_STATUSES = tuple(HandoffStatus)` once to map indices back
+   - Older transitions fall off the buffer; the full audit trail is the
+     OTel events emitted by HandoffEventEmitter (events.py)
 
 7. Preserve backward compatibility - existing code using old states must still work
 
@@ -89,37 +144,47 @@ enabling monitoring and debugging of handoff lifecycle.
 
 ## Requirements
 
-1. Create HandoffEventType enum:
+1. Create HandoffEventType as a plain class of `Final` string constants, NOT
+   an Enum - event names are read on every emit, and plain class attributes
+   avoid the EnumMeta descriptor lookup:
    ```python
-   class HandoffEventType(str, Enum):
-       CREATED = "handoff.created"
-       STATUS_UPDATE = "handoff.status_update"
-       INPUT_REQUIRED = "handoff.input_required"
-       INPUT_PROVIDED = "handoff.input_provided"
-       ARTIFACT_ADDED = "handoff.artifact_added"
-       MESSAGE_ADDED = "handoff.message_added"
-       TIMEOUT_WARNING = "handoff.timeout_warning"
-       COMPLETED = "handoff.completed"
-       FAILED = "handoff.failed"
+   class HandoffEventType:
+       CREATED: Final = "handoff.created"
+       STATUS_UPDATE: Final = "handoff.status_update"
+       INPUT_REQUIRED: Final = "handoff.input_required"
+       INPUT_PROVIDED: Final = "handoff.input_provided"
+       ARTIFACT_ADDED: Final = "handoff.artifact_added"
+       MESSAGE_ADDED: Final = "handoff.message_added"
+       TIMEOUT_WARNING: Final = "handoff.timeout_warning"
+       COMPLETED: Final = "handoff.completed"
+       FAILED: Final = "handoff.failed"
+
+   HANDOFF_EVENT_TYPES: frozenset[str] = frozenset(
+       value for name, value in vars(HandoffEventType).items() if name.isupper()
+   )
    ```
 
 2. Create HandoffEvent dataclass:
    ```python
    @dataclass
    class HandoffEvent:
-       event_type: HandoffEventType
+       event_type: str  # one of the HandoffEventType constants
        handoff_id: str
        timestamp: datetime
        from_status: HandoffStatus | None = None
        to_status: HandoffStatus | None = None
        agent_id: str | None = None
        message: str | None = None
-       metadata: dict[str, Any] = field(default_factory=dict)
+       metadata: Mapping[str, Any] = _EMPTY_META
    ```
+   `_EMPTY_META = MappingProxyType({})` is a shared read-only default: an
+   event is built per state change and most carry no metadata. Code that
+   has metadata passes its own dict at construction.
 
 3. Create HandoffEventEmitter class:
    - __init__(tracer_name: str = "contextcore.handoffs")
-   - _tracer from trace.get_tracer(tracer_name)
+   - _tracer from trace.get_tracer(tracer_name), obtained once here and
+     reused by every emit method (never call get_tracer per emit)
 
 4. Implement emit methods:
    - emit_created(handoff_id, from_agent, to_agent, capability_id) -> None
@@ -133,8 +198,16 @@ enabling monitoring and debugging of handoff lifecycle.
 
 5. Each emit method should:
    - Create an OTel span with appropriate name
-   - Set span attributes for all parameters
-   - Add span event with event details
+   - Build one attribute dict for all parameters, dropping None values:
+     `attrs = {k: v for k, v in (("handoff.id", handoff_id), ...) if v is not None}`
+   - Attribute keys come from module-level constants shared by all emit
+     methods, e.g. `_ATTR_HANDOFF_ID: Final = "handoff.id"`,
+     `_ATTR_FROM_STATUS: Final = "handoff.from_status"`,
+     `_ATTR_TO_STATUS`, `_ATTR_AGENT_ID`, `_ATTR_REASON`; span and event
+     names come from HandoffEventType. No key or name literals inside emit
+     methods
+   - Call `span.set_attributes(attrs)` exactly once (no per-key set_attribute)
+   - Add one span event with the same dict: `span.add_event(name, attributes=attrs)`
    - Log at appropriate level
 
 6. Create global default emitter instance
@@ -162,16 +235,22 @@ enters the INPUT_REQUIRED state, enabling interactive workflows.
 
 ## Requirements
 
-1. Create InputType enum:
+1. Create InputType as a plain class of `Final` string constants (not an
+   Enum; validate_response branches on it for every response):
    ```python
-   class InputType(str, Enum):
-       TEXT = "text"                # Free-form text input
-       CHOICE = "choice"            # Single selection from options
-       MULTI_CHOICE = "multi_choice"  # Multiple selections
-       CONFIRMATION = "confirmation"   # Yes/No confirmation
-       FILE = "file"                # File upload
-       JSON = "json"                # Structured JSON input
+   class InputType:
+       TEXT: Final = "text"                  # Free-form text input
+       CHOICE: Final = "choice"              # Single selection from options
+       MULTI_CHOICE: Final = "multi_choice"  # Multiple selections
+       CONFIRMATION: Final = "confirmation"  # Yes/No confirmation
+       FILE: Final = "file"                  # File upload
+       JSON: Final = "json"                  # Structured JSON input
+
+   INPUT_TYPE_VALUES: frozenset[str] = frozenset(
+       value for name, value in vars(InputType).items() if name.isupper()
+   )
    ```
+   Deserialization checks `value in INPUT_TYPE_VALUES` instead of `InputType(value)`.
 
 2. Create InputOption dataclass:
    ```python
@@ -190,7 +269,7 @@ enters the INPUT_REQUIRED state, enabling interactive workflows.
        request_id: str
        handoff_id: str
        question: str
-       input_type: InputType
+       input_type: str  # one of the InputType constants
        options: list[InputOption] | None = None
        default_value: str | None = None
        required: bool = True
@@ -198,8 +277,17 @@ enters the INPUT_REQUIRED state, enabling interactive workflows.
        validation_pattern: str | None = None  # Regex for TEXT type
        min_selections: int | None = None  # For MULTI_CHOICE
        max_selections: int | None = None  # For MULTI_CHOICE
-       created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+       created_at: datetime = field(default_factory=utc_now)
        expires_at: datetime | None = None
+       # Derived once in __post_init__ so validate_response does no setup work
+       _compiled_pattern: re.Pattern[str] | None = field(default=None, init=False, repr=False)
+       _option_values: frozenset[str] = field(default=frozenset(), init=False, repr=False)
+
+       def __post_init__(self):
+           if self.validation_pattern:
+               self._compiled_pattern = re.compile(self.validation_pattern)
+           if self.options:
+               self._option_values = frozenset(o.value for o in self.options)
 
        def is_expired(self) -> bool:
            if self.expires_at:
@@ -210,6 +298,9 @@ enters the INPUT_REQUIRED state, enabling interactive workflows.
            '''Validate input response. Returns (is_valid, error_message).'''
            ...
    ```
+   - TEXT: match with `self._compiled_pattern.match(value)`, never
+     `re.match(self.validation_pattern, ...)`
+   - CHOICE / MULTI_CHOICE: membership against `self._option_values`
 
 4. Create InputResponse dataclass:
    ```python
@@ -219,7 +310,7 @@ enters the INPUT_REQUIRED state, enabling interactive workflows.
        handoff_id: str
        value: Any  # str, list[str], bool, dict depending on InputType
        responded_by: str  # agent_id or user_id
-       responded_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+       responded_at: datetime = field(default_factory=utc_now)
    ```
 
 5. Create InputRequestManager class:
@@ -234,6 +325,11 @@ enters the INPUT_REQUIRED state, enabling interactive workflows.
    - InputRequest.confirmation(handoff_id, question) -> InputRequest
    - InputRequest.choice(handoff_id, question, options) -> InputRequest
    - InputRequest.text(handoff_id, question, validation_pattern) -> InputRequest
+   - created_at / responded_at default to `utc_now` from
+     contextcore.models._clock (1ms-coalesced); is_expired() keeps using
+     datetime.now(timezone.utc) because it needs the exact current time
+   - Generate request_id with `next_id("input")` from contextcore.models._ids
+     (not uuid4) in the factories and in InputRequestManager.create_request
 
 ## Output Format
 Provide clean Python code with:
@@ -0,0 +1,36 @@
+"""
+Lazy loading of task prompts stored under tasks/prompts/.
+
+Task prompts are multi-kilobyte Markdown documents. Keeping them on disk
+instead of as module-level string constants means importing the task
+registry does not parse or hold every prompt; a prompt is read the first
+time its Feature is actually run.
+"""
+
+import functools
+from importlib import resources
+from typing import Callable
+
+
+@functools.cache
+def load_prompt(name: str) -> str:
+    """Read prompts/<name>.md (cached after the first read)."""
+    return resources.files(__package__).joinpath("prompts", f"{name}.md").read_text(encoding="utf-8")
+
+
+@functools.cache
+def compose_prompt(name: str, fragments: tuple[str, ...]) -> str:
+    """prompts/<name>.md followed by shared prompts/<fragment>.md sections."""
+    parts = [load_prompt(name), *(load_prompt(fragment) for fragment in fragments)]
+    return "".join(parts)
+
+
+def lazy_prompt(name: str, *fragments: str) -> Callable[[], str]:
+    """Return a zero-argument loader for prompts/<name>.md, for use as Feature.task.
+
+    ``fragments`` name shared prompt sections (e.g. a common output-format
+    footer) appended after the main prompt, so the text lives in one file.
+    """
+    if fragments:
+        return functools.partial(compose_prompt, name, fragments)
+    return functools.partial(load_prompt, name)
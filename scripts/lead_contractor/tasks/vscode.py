@@ -28,14 +28,19 @@ configuration files, ready for TypeScript development.
    - engines.vscode: "^1.85.0"
    - categories: ["Other", "Visualization"]
    - activationEvents: ["workspaceContains:**/.contextcore", "workspaceContains:**/projectcontext.yaml"]
-   - main: "./out/extension.js"
+   - main: "./dist/extension.js" (single esbuild bundle, see scripts.build)
    - contributes:
      - configuration (contextcore.kubeconfig, contextcore.namespace, contextcore.showInlineHints, contextcore.refreshInterval)
      - viewsContainers.activitybar (contextcore icon)
      - views.contextcore (projectView, risksView, requirementsView)
      - commands (contextcore.refresh, contextcore.showImpact, contextcore.openDashboard, contextcore.showRisks)
-   - scripts: compile, watch, package, lint, test
-   - devDependencies: typescript, @types/vscode, @types/node, eslint, @typescript-eslint/parser, @typescript-eslint/eslint-plugin, vsce
+   - scripts: compile (tsc type-check), build, watch, package (runs build), lint, test
+   - scripts.build: "esbuild src/extension.ts --bundle --platform=node --target=node18 --external:vscode --format=cjs --minify --sourcemap --outfile=dist/extension.js"
+     (activation then loads one file instead of walking node_modules; lazily
+     imported dependencies are bundled too and only evaluated on first use)
+   - scripts.build also bundles src/workers/yamlWorker.ts to dist/yamlWorker.js
+     (same flags); the YAML parse pool loads it from next to the bundle
+   - devDependencies: typescript, @types/vscode, @types/node, eslint, @typescript-eslint/parser, @typescript-eslint/eslint-plugin, vsce, esbuild
    - dependencies: yaml, @kubernetes/client-node
 
 2. Create tsconfig.json with:
@@ -49,7 +54,8 @@ configuration files, ready for TypeScript development.
    - skipLibCheck: true
    - forceConsistentCasingInFileNames: true
 
-3. Create .vscodeignore with: .vscode, node_modules, src, .gitignore, tsconfig.json, *.map
+3. Create .vscodeignore with: .vscode, node_modules, src, out, .gitignore, tsconfig.json, *.map
+   (everything the extension needs at runtime is in dist/extension.js)
 
 4. Create .eslintrc.json with TypeScript rules
 
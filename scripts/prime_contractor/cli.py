@@ -41,7 +41,8 @@ def cmd_run(args):
         auto_commit=args.auto_commit,
         strict_checkpoints=args.strict,
         allow_dirty=args.allow_dirty,
-        auto_stash=args.auto_stash
+        auto_stash=args.auto_stash,
+        parallel_develop=args.parallel_develop
     )
 
     # Import from backlog if requested
@@ -285,11 +286,11 @@ def cmd_recover(args):
         status = workflow.get_recovery_status()
 
         if status["stashes"]:
-            print("\nPrime Contractor stashes:")
+            print("\nPrime Contractor snapshots:")
             for stash in status["stashes"]:
                 print(f"  {stash}")
         else:
-            print("\nNo prime-contractor stashes found")
+            print("\nNo prime-contractor snapshots found")
 
         if status["backup_files"]:
             print(f"\nBackup files ({len(status['backup_files'])}):")
@@ -377,6 +378,8 @@ Examples:
                            help="Proceed even if repo has uncommitted changes (not recommended)")
     run_parser.add_argument("--auto-stash", action="store_true",
                            help="Automatically stash uncommitted changes before running (recommended)")
+    run_parser.add_argument("--parallel-develop", type=int, default=1, metavar="N",
+                           help="Generate code for up to N independent features at once (integration stays sequential)")
     run_parser.set_defaults(func=cmd_run)
     
     # Status command
@@ -433,9 +436,9 @@ Examples:
     recover_parser = subparsers.add_parser("recover",
                                            help="Recover from a failed integration")
     recover_parser.add_argument("--status", "-s", action="store_true",
-                               help="Show recovery status (stashes, backups)")
+                               help="Show recovery status (snapshots, backups)")
     recover_parser.add_argument("--to-snapshot", action="store_true",
-                               help="Recover from the most recent prime-contractor stash")
+                               help="Recover from the most recent prime-contractor snapshot")
     recover_parser.add_argument("--file", type=str,
                                help="Recover a specific file from its .backup")
     recover_parser.set_defaults(func=cmd_recover)
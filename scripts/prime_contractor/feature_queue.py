@@ -9,11 +9,12 @@ The feature queue ensures:
 """
 
 import json
+import threading
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterator, List, Optional, Set
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 
@@ -79,6 +80,9 @@ class FeatureQueue:
         self.order: List[str] = []  # Processing order
         self.state_file = state_file or (PROJECT_ROOT / ".prime_contractor_state.json")
         self.auto_save = auto_save
+
+        # Features may be developed concurrently; serialize state writes
+        self._save_lock = threading.Lock()
         
         # Load existing state if available
         if self.state_file.exists():
@@ -143,6 +147,10 @@ class FeatureQueue:
         1. Is in PENDING or GENERATED status
         2. Has all dependencies completed
         """
+        return next(self.iter_ready_features(), None)
+
+    def iter_ready_features(self) -> Iterator[FeatureSpec]:
+        """Yield, in processing order, every feature get_next_feature could return."""
         for feature_id in self.order:
             feature = self.features.get(feature_id)
             if not feature:
@@ -161,9 +169,7 @@ class FeatureQueue:
                     break
             
             if deps_met and feature.status in (FeatureStatus.PENDING, FeatureStatus.GENERATED):
-                return feature
-        
-        return None
+                yield feature
     
     def start_feature(self, feature_id: str) -> bool:
         """Mark a feature as started (developing)."""
@@ -269,16 +275,17 @@ class FeatureQueue:
     
     def save_state(self):
         """Save queue state to file."""
-        state = {
-            "features": {
-                fid: f.to_dict() for fid, f in self.features.items()
-            },
-            "order": self.order,
-            "saved_at": datetime.now().isoformat()
-        }
-        
-        with open(self.state_file, "w") as f:
-            json.dump(state, f, indent=2)
+        with self._save_lock:
+            state = {
+                "features": {
+                    fid: f.to_dict() for fid, f in self.features.items()
+                },
+                "order": self.order,
+                "saved_at": datetime.now().isoformat()
+            }
+            
+            with open(self.state_file, "w") as f:
+                json.dump(state, f, indent=2)
     
     def load_state(self) -> bool:
         """Load queue state from file."""
@@ -17,17 +17,23 @@ next begins, the Prime Contractor coordinates Lead Contractor tasks and
 ensures each feature is integrated before moving on.
 """
 
+import functools
 import json
+import os
 import shutil
 import subprocess
 import sys
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
 
-from opentelemetry import trace
+if TYPE_CHECKING:
+    from opentelemetry.trace import Tracer
 
-from contextcore.tracing.insight_emitter import InsightEmitter
+    from contextcore.tracing.insight_emitter import InsightEmitter
 
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent.parent
@@ -44,7 +50,8 @@ from scripts.prime_contractor.feature_queue import (
     FeatureStatus,
 )
 
-# Import lead contractor functions
+# Import lead contractor functions (the runner, which pulls in OpenTelemetry
+# and the agent configuration, is imported by develop_feature when needed)
 from scripts.lead_contractor.integrate_backlog import (
     scan_backlog,
     generate_integration_plan,
@@ -58,12 +65,51 @@ from scripts.lead_contractor.integrate_backlog import (
     detect_incomplete_file,
     clean_markdown_code_blocks,
 )
-from scripts.lead_contractor.runner import (
-    Feature,
-    run_workflow as run_lead_contractor,
-    save_result,
-    get_result_file_path,
-)
+
+
+@functools.cache
+def _get_tracer() -> "Tracer":
+    # Deferred so CLI commands that never trace skip importing OpenTelemetry
+    from opentelemetry import trace
+    return trace.get_tracer("contextcore.prime_contractor")
+
+
+# detect_incomplete_file marks issues that block integration with this prefix
+_TRUNCATION_PREFIX = "TRUNCATED:"
+
+# Safety snapshots are stash commits kept under this ref namespace
+SNAPSHOT_REF_NAMESPACE = "refs/prime-contractor/"
+
+# Directories never holding integration backups, skipped when searching for them
+_BACKUP_SEARCH_SKIP_DIRS = frozenset({
+    ".git", "node_modules", "__pycache__", ".venv", "dist", "build",
+})
+
+
+def _find_backups(root: Path) -> List[str]:
+    """Paths of all *.backup files under root, found with an os.scandir walk."""
+    backups: List[str] = []
+    stack = [str(root)]
+
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _BACKUP_SEARCH_SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith(".backup"):
+                        backups.append(entry.path)
+        except OSError:
+            continue  # Unreadable directory
+
+    return backups
+
+
+@functools.lru_cache(maxsize=1024)
+def _analyze_file_cached(path_str: str, mtime_ns: int, size: int) -> Dict:
+    """analyze_file_content keyed by stat, so a changed file is re-read."""
+    return analyze_file_content(Path(path_str))
 
 
 class PrimeContractorWorkflow:
@@ -92,6 +138,7 @@ class PrimeContractorWorkflow:
         max_retries: int = 2,
         allow_dirty: bool = False,
         auto_stash: bool = False,
+        parallel_develop: int = 1,
         on_feature_complete: Optional[Callable[[FeatureSpec], None]] = None,
         on_checkpoint_failed: Optional[Callable[[FeatureSpec, List[CheckpointResult]], None]] = None,
     ):
@@ -102,11 +149,18 @@ class PrimeContractorWorkflow:
         self.max_retries = max_retries
         self.allow_dirty = allow_dirty
         self.auto_stash = auto_stash
+        self.parallel_develop = max(1, parallel_develop)
         self.on_feature_complete = on_feature_complete
         self.on_checkpoint_failed = on_checkpoint_failed
 
         # Git safety: track stash reference for recovery
         self.stash_ref: Optional[str] = None
+
+        # Resolved paths of tracked files with staged or unstaged changes,
+        # from a single `git status`; None until first needed or after the
+        # working tree is changed by this workflow
+        self._dirty_cache: Optional[Set[Path]] = None
+        self._git_toplevel: Optional[Path] = None
         
         self.queue = FeatureQueue()
         self.checkpoint = IntegrationCheckpoint(
@@ -119,11 +173,8 @@ class PrimeContractorWorkflow:
         self.integration_history: List[Dict] = []
         self.files_modified_this_session: Dict[str, List[str]] = {}  # file -> [features]
 
-        # OpenTelemetry tracer for code generation spans
-        self.tracer = trace.get_tracer("contextcore.prime_contractor")
-
-        # Insight emitter for workflow decisions (BLC-008)
-        self.insight_emitter = InsightEmitter()
+        # Insight emitter for workflow decisions (BLC-008), created on first use
+        self._insight_emitter: Optional["InsightEmitter"] = None
 
         # Size limits for proactive truncation prevention
         self.max_lines_per_feature = 150  # Safe limit for most LLMs
@@ -133,6 +184,24 @@ class PrimeContractorWorkflow:
         self.total_cost_usd: float = 0.0
         self.total_input_tokens: int = 0
         self.total_output_tokens: int = 0
+        self._cost_lock = threading.Lock()
+
+        # Raw content of the files last checked by validate_generated_code,
+        # keyed by generated_files entry, reused when integrating them
+        self._validated_sources: Dict[str, str] = {}
+
+    @property
+    def tracer(self) -> "Tracer":
+        """OpenTelemetry tracer for code generation spans."""
+        return _get_tracer()
+
+    @property
+    def insight_emitter(self) -> "InsightEmitter":
+        """Insight emitter for workflow decisions (BLC-008)."""
+        if self._insight_emitter is None:
+            from contextcore.tracing.insight_emitter import InsightEmitter
+            self._insight_emitter = InsightEmitter()
+        return self._insight_emitter
 
     def check_git_status(self) -> Tuple[bool, List[str]]:
         """
@@ -154,57 +223,154 @@ class PrimeContractorWorkflow:
 
     def create_safety_snapshot(self) -> Optional[str]:
         """
-        Create a safety snapshot (git stash) before integration.
+        Create a safety snapshot before integration.
+
+        Uncommitted changes to tracked files are saved as a stash commit
+        under refs/prime-contractor/ (not on the user's stash stack), then
+        cleared from the working tree as `git stash push` would.
 
         Returns:
-            Stash reference name if created, None if nothing to stash
+            Snapshot ref name if created, None if nothing to snapshot
         """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         stash_message = f"prime-contractor-snapshot-{timestamp}"
+        snapshot_ref = f"{SNAPSHOT_REF_NAMESPACE}{stash_message}"
 
         result = subprocess.run(
-            ["git", "stash", "push", "-m", stash_message],
+            ["git", "stash", "create", stash_message],
             capture_output=True,
             text=True,
             cwd=self.project_root
         )
 
-        if "No local changes to save" in result.stdout:
+        stash_sha = result.stdout.strip()
+        if result.returncode != 0 or not stash_sha:
+            return None  # Nothing to snapshot (or not a git repo)
+
+        result = subprocess.run(
+            ["git", "update-ref", "-m", stash_message, snapshot_ref, stash_sha],
+            capture_output=True,
+            text=True,
+            cwd=self.project_root
+        )
+        if result.returncode != 0:
             return None
 
-        if result.returncode == 0:
-            self.stash_ref = stash_message
-            return stash_message
+        # Only clear the working tree once the snapshot is safely referenced
+        result = subprocess.run(
+            ["git", "reset", "--hard", "-q"],
+            capture_output=True,
+            text=True,
+            cwd=self.project_root
+        )
+        self.invalidate_dirty_cache()
+        if result.returncode != 0:
+            return None
+
+        self.stash_ref = snapshot_ref
+        return snapshot_ref
+
+    def _list_snapshots(self) -> List[str]:
+        """Snapshot refs under refs/prime-contractor/, newest first."""
+        result = subprocess.run(
+            ["git", "for-each-ref", "--sort=-refname",
+             "--format=%(refname)", SNAPSHOT_REF_NAMESPACE],
+            capture_output=True,
+            text=True,
+            cwd=self.project_root
+        )
+        return [line for line in result.stdout.split('\n') if line]
+
+    def _refresh_dirty_cache(self) -> Set[Path]:
+        """
+        Rebuild the set of tracked files with uncommitted changes.
+
+        One `git status` call replaces a pair of `git diff` calls per file.
+        Untracked files are excluded, matching what `git diff` reports.
+
+        Returns:
+            Set of resolved paths with staged or unstaged changes
+        """
+        dirty: Set[Path] = set()
+
+        if self._git_toplevel is None:
+            toplevel = subprocess.run(
+                ["git", "rev-parse", "--show-toplevel"],
+                capture_output=True,
+                text=True,
+                cwd=self.project_root
+            )
+            if toplevel.returncode == 0:
+                # Porcelain paths are relative to the repository root
+                self._git_toplevel = Path(toplevel.stdout.strip())
+
+        result = subprocess.run(
+            ["git", "status", "--porcelain=v1", "-z",
+             "--untracked-files=no", "--ignore-submodules=dirty"],
+            capture_output=True,
+            text=True,
+            cwd=self.project_root
+        )
+
+        repo_root = self._git_toplevel
+        if repo_root is not None and result.returncode == 0:
+            entries = iter(result.stdout.split("\0"))
+            for entry in entries:
+                if len(entry) < 4:
+                    continue
+                dirty.add((repo_root / entry[3:]).resolve())
+                # Renames and copies are followed by their original path
+                if entry[0] in "RC" or entry[1] in "RC":
+                    next(entries, None)
+
+        self._dirty_cache = dirty
+        return dirty
 
-        return None
+    def invalidate_dirty_cache(self):
+        """Forget cached dirty-file state after the working tree changes."""
+        self._dirty_cache = None
 
     def is_file_dirty(self, path: Path) -> bool:
         """
         Check if a specific file has uncommitted changes.
 
+        Answered from a cached `git status` snapshot (see _refresh_dirty_cache).
+
         Args:
             path: Path to the file to check
 
         Returns:
             True if file has uncommitted changes
         """
-        # Check staged changes
-        result_staged = subprocess.run(
-            ["git", "diff", "--cached", "--name-only", str(path)],
-            capture_output=True,
-            text=True,
-            cwd=self.project_root
-        )
+        return not self.protect_dirty_targets([path])[path]
 
-        # Check unstaged changes
-        result_unstaged = subprocess.run(
-            ["git", "diff", "--name-only", str(path)],
-            capture_output=True,
-            text=True,
-            cwd=self.project_root
-        )
+    def protect_dirty_targets(self, paths: List[Path]) -> Dict[Path, bool]:
+        """
+        Check which target files are safe to overwrite, in one pass.
 
-        return bool(result_staged.stdout.strip() or result_unstaged.stdout.strip())
+        All paths are checked against the same `git status` snapshot, so a
+        feature with many targets costs at most one git call.
+
+        Args:
+            paths: Paths to the target files
+
+        Returns:
+            Dict mapping each path to True if safe to overwrite, False if it
+            has uncommitted changes
+        """
+        dirty = self._dirty_cache
+        if dirty is None:
+            dirty = self._refresh_dirty_cache()
+
+        safe: Dict[Path, bool] = {}
+        for path in paths:
+            resolved = path if path.is_absolute() else self.project_root / path
+            safe[path] = resolved.resolve() not in dirty
+        return safe
+
+    def _warn_dirty_target(self, path: Path):
+        print(f"  Target file has uncommitted changes: {path.name}")
+        print(f"     Commit or stash changes first, then retry")
 
     def protect_dirty_target(self, path: Path) -> bool:
         """
@@ -222,8 +388,7 @@ class PrimeContractorWorkflow:
             return True  # New file, safe to create
 
         if self.is_file_dirty(path):
-            print(f"  Target file has uncommitted changes: {path.name}")
-            print(f"     Commit or stash changes first, then retry")
+            self._warn_dirty_target(path)
             return False
 
         return True
@@ -236,64 +401,53 @@ class PrimeContractorWorkflow:
             Dict with stash_ref, backup_files, and recovery options
         """
         # Find backup files
-        backup_files = list(self.project_root.glob("**/*.backup"))
+        backup_files = _find_backups(self.project_root)
 
-        # Check for stash
-        result = subprocess.run(
-            ["git", "stash", "list"],
-            capture_output=True,
-            text=True,
-            cwd=self.project_root
-        )
-        stashes = [
-            line for line in result.stdout.strip().split('\n')
-            if line and "prime-contractor-snapshot" in line
-        ]
+        # Check for snapshots
+        stashes = self._list_snapshots()
 
         return {
             "stash_ref": self.stash_ref,
             "stashes": stashes,
-            "backup_files": [str(f) for f in backup_files],
+            "backup_files": backup_files,
             "has_recovery_options": bool(stashes or backup_files),
         }
 
     def recover_from_stash(self) -> bool:
         """
-        Recover from the most recent prime-contractor stash.
+        Recover from the most recent prime-contractor snapshot.
 
         Returns:
             True if recovery succeeded
         """
-        # Find prime-contractor stashes
-        result = subprocess.run(
-            ["git", "stash", "list"],
+        snapshots = self._list_snapshots()
+        if not snapshots:
+            print("  No prime-contractor snapshot found")
+            return False
+
+        snapshot_ref = snapshots[0]
+        print(f"  Recovering from: {snapshot_ref}")
+
+        apply_result = subprocess.run(
+            ["git", "stash", "apply", snapshot_ref],
             capture_output=True,
             text=True,
             cwd=self.project_root
         )
+        self.invalidate_dirty_cache()
 
-        for line in result.stdout.strip().split('\n'):
-            if "prime-contractor-snapshot" in line:
-                # Extract stash reference (e.g., "stash@{0}")
-                stash_id = line.split(":")[0]
-                print(f"  Recovering from: {line}")
-
-                pop_result = subprocess.run(
-                    ["git", "stash", "pop", stash_id],
-                    capture_output=True,
-                    text=True,
-                    cwd=self.project_root
-                )
-
-                if pop_result.returncode == 0:
-                    print(f"  Recovery successful")
-                    return True
-                else:
-                    print(f"  Recovery failed: {pop_result.stderr}")
-                    return False
+        if apply_result.returncode != 0:
+            print(f"  Recovery failed: {apply_result.stderr}")
+            return False
 
-        print("  No prime-contractor stash found")
-        return False
+        # Applied cleanly: drop the snapshot, as `git stash pop` would
+        subprocess.run(
+            ["git", "update-ref", "-d", snapshot_ref],
+            capture_output=True,
+            cwd=self.project_root
+        )
+        print(f"  Recovery successful")
+        return True
 
     def recover_file_from_backup(self, file_path: Path) -> bool:
         """
@@ -312,6 +466,7 @@ class PrimeContractorWorkflow:
             return False
 
         shutil.copy2(backup_path, file_path)
+        self.invalidate_dirty_cache()
         print(f"  Restored: {file_path} from {backup_path.name}")
         return True
 
@@ -335,23 +490,18 @@ class PrimeContractorWorkflow:
         plan = generate_integration_plan(files)
         
         # Group by target to detect potential conflicts BEFORE they happen
-        target_to_features: Dict[str, List[str]] = {}
-        
+        target_to_features: Dict[str, List[str]] = defaultdict(list)
         for item in plan.get("files", []):
-            target = item.get("target", "")
-            feature = item.get("feature", "unknown")
-            
-            if target not in target_to_features:
-                target_to_features[target] = []
-            target_to_features[target].append(feature)
+            target_to_features[item.get("target", "")].append(item.get("feature", "unknown"))
         
         # Warn about potential conflicts
-        conflicts = {t: fs for t, fs in target_to_features.items() if len(fs) > 1}
+        conflicts = [(t, fs) for t, fs in target_to_features.items() if len(fs) > 1]
         if conflicts:
             print(f"\n⚠️  POTENTIAL CONFLICTS DETECTED:")
             print(f"   {len(conflicts)} target(s) have multiple features:")
-            for target, features in list(conflicts.items())[:5]:
-                target_rel = Path(target).relative_to(self.project_root) if target else "unknown"
+            project_root_str = str(self.project_root)
+            for target, features in conflicts[:5]:
+                target_rel = os.path.relpath(target, project_root_str) if target else "unknown"
                 print(f"   • {target_rel}:")
                 for f in features:
                     print(f"     - {f}")
@@ -364,12 +514,49 @@ class PrimeContractorWorkflow:
         print(f"Imported {len(added)} feature(s) from backlog")
         return len(added)
     
+    def _validate_one_file(self, source_file: str) -> Tuple[List[str], Optional[int], Optional[str]]:
+        """
+        Validate a single generated file.
+
+        Returns:
+            Tuple of (error messages, line count for Python files else None,
+            raw file content if it could be read)
+        """
+        source_path = Path(source_file)
+
+        if not source_path.exists():
+            return [f"Source file not found: {source_path}"], None, None
+
+        try:
+            with open(source_path, 'r', encoding='utf-8') as f:
+                raw_content = f.read()
+        except Exception as e:
+            return [f"Failed to read {source_path.name}: {e}"], None, None
+
+        if source_path.suffix != '.py':
+            return [], None, raw_content
+
+        # Clean markdown code blocks
+        content = clean_markdown_code_blocks(raw_content)
+        actual_lines = content.count('\n') + 1
+
+        # Check for truncation and other issues
+        issues = detect_incomplete_file(content, source_path)
+
+        if any(i.startswith(_TRUNCATION_PREFIX) for i in issues):
+            truncation_issues = "; ".join(i for i in issues if i.startswith(_TRUNCATION_PREFIX))
+            return [f"{source_path.name}: {truncation_issues}"], actual_lines, raw_content
+        return [], actual_lines, raw_content
+
     def validate_generated_code(self, feature: FeatureSpec) -> Tuple[bool, List[str]]:
         """
         Validate generated code files before integration.
 
         Checks for truncation, syntax errors, and other issues that would
-        corrupt the target codebase if integrated.
+        corrupt the target codebase if integrated. Files are read and checked
+        on a small thread pool; errors are reported in generated_files order.
+        The content read is kept so integrate_feature writes exactly what was
+        validated without reading each file again.
 
         Args:
             feature: Feature spec with generated_files list
@@ -378,52 +565,45 @@ class PrimeContractorWorkflow:
             Tuple of (is_valid, list of error messages)
         """
         errors = []
+        source_files = feature.generated_files
 
         with self.tracer.start_as_current_span("code_generation.verify") as span:
-            span.set_attribute("gen_ai.code.feature_name", feature.name)
-            span.set_attribute("gen_ai.code.file_count", len(feature.generated_files))
-
-            for source_file in feature.generated_files:
-                source_path = Path(source_file)
-
-                if not source_path.exists():
-                    errors.append(f"Source file not found: {source_path}")
-                    continue
-
-                try:
-                    with open(source_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                except Exception as e:
-                    errors.append(f"Failed to read {source_path.name}: {e}")
-                    continue
-
-                # Clean markdown code blocks
-                if source_path.suffix == '.py':
-                    content = clean_markdown_code_blocks(content)
-
+            if len(source_files) > 1:
+                max_workers = min(32, (os.cpu_count() or 4) * 4, len(source_files))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    results = list(executor.map(self._validate_one_file, source_files))
+            else:
+                results = [self._validate_one_file(f) for f in source_files]
+
+            attributes: Dict[str, Any] = {
+                "gen_ai.code.feature_name": feature.name,
+                "gen_ai.code.file_count": len(source_files),
+            }
+            self._validated_sources = {}
+            for source_file, (file_errors, actual_lines, raw_content) in zip(
+                source_files, results, strict=True
+            ):
+                errors.extend(file_errors)
+                if raw_content is not None:
+                    self._validated_sources[source_file] = raw_content
+                if actual_lines is not None:
                     # Record actual line count
-                    actual_lines = content.count('\n') + 1
-                    span.set_attribute("gen_ai.code.actual_lines", actual_lines)
-
-                    # Check for truncation and other issues
-                    issues = detect_incomplete_file(content, source_path)
-                    truncation_issues = [i for i in issues if i.startswith("TRUNCATED:")]
-
-                    if truncation_issues:
-                        errors.append(f"{source_path.name}: {'; '.join(truncation_issues)}")
+                    attributes["gen_ai.code.actual_lines"] = actual_lines
 
             is_valid = len(errors) == 0
 
             # Record validation result
-            span.set_attribute("gen_ai.code.truncated", not is_valid)
-            span.set_attribute("gen_ai.code.verification_result", "PASSED" if is_valid else "FAILED")
+            attributes["gen_ai.code.truncated"] = not is_valid
+            attributes["gen_ai.code.verification_result"] = "PASSED" if is_valid else "FAILED"
+
+            if not is_valid and span.is_recording():
+                attributes["gen_ai.code.verification_issues"] = json.dumps(errors[:5])
 
-            if not is_valid:
-                span.set_attribute("gen_ai.code.verification_issues", json.dumps(errors[:5]))
+            span.set_attributes(attributes)
 
         return is_valid, errors
 
-    def pre_flight_validation(self, feature: FeatureSpec) -> Tuple[bool, Optional[Dict]]:
+    def pre_flight_validation(self, feature: FeatureSpec, verbose: bool = True) -> Tuple[bool, Optional[Dict]]:
         """
         Perform pre-flight size estimation BEFORE code generation.
 
@@ -432,6 +612,7 @@ class PrimeContractorWorkflow:
 
         Args:
             feature: Feature specification to validate
+            verbose: Print the size estimate (warnings are always printed)
 
         Returns:
             Tuple of (should_proceed, decomposition_info)
@@ -441,9 +622,6 @@ class PrimeContractorWorkflow:
         from contextcore.agent.size_estimation import SizeEstimator
 
         with self.tracer.start_as_current_span("code_generation.preflight") as span:
-            span.set_attribute("gen_ai.code.feature_name", feature.name)
-            span.set_attribute("gen_ai.code.max_lines_allowed", self.max_lines_per_feature)
-
             # Estimate output size
             estimator = SizeEstimator()
             estimate = estimator.estimate(
@@ -454,16 +632,23 @@ class PrimeContractorWorkflow:
                 },
             )
 
-            span.set_attribute("gen_ai.code.estimated_lines", estimate.lines)
-            span.set_attribute("gen_ai.code.estimated_tokens", estimate.tokens)
-            span.set_attribute("gen_ai.code.estimated_complexity", estimate.complexity)
-            span.set_attribute("gen_ai.code.estimation_confidence", estimate.confidence)
-            span.set_attribute("gen_ai.code.estimation_reasoning", estimate.reasoning)
-
-            print(f"\n  Pre-flight size estimation:")
-            print(f"    Estimated lines: {estimate.lines}")
-            print(f"    Complexity: {estimate.complexity}")
-            print(f"    Confidence: {estimate.confidence:.0%}")
+            attributes: Dict[str, Any] = {
+                "gen_ai.code.feature_name": feature.name,
+                "gen_ai.code.max_lines_allowed": self.max_lines_per_feature,
+                "gen_ai.code.estimated_lines": estimate.lines,
+                "gen_ai.code.estimated_tokens": estimate.tokens,
+                "gen_ai.code.estimated_complexity": estimate.complexity,
+                "gen_ai.code.estimation_confidence": estimate.confidence,
+            }
+            if span.is_recording():
+                attributes["gen_ai.code.estimation_reasoning"] = estimate.reasoning
+            span.set_attributes(attributes)
+
+            if verbose:
+                print(f"\n  Pre-flight size estimation:")
+                print(f"    Estimated lines: {estimate.lines}")
+                print(f"    Complexity: {estimate.complexity}")
+                print(f"    Confidence: {estimate.confidence:.0%}")
 
             if estimate.lines > self.max_lines_per_feature:
                 span.set_attribute("gen_ai.code.action", "decompose")
@@ -474,8 +659,12 @@ class PrimeContractorWorkflow:
                     "max_allowed": self.max_lines_per_feature,
                 })
 
-                print(f"\n  WARNING: Estimated output ({estimate.lines} lines) exceeds safe limit ({self.max_lines_per_feature})")
-                print(f"    Consider splitting this feature into smaller tasks.")
+                if verbose:
+                    print(f"\n  WARNING: Estimated output ({estimate.lines} lines) exceeds safe limit ({self.max_lines_per_feature})")
+                    print(f"    Consider splitting this feature into smaller tasks.")
+                else:
+                    print(f"  [{feature.name}] WARNING: Estimated output ({estimate.lines} lines) "
+                          f"exceeds safe limit ({self.max_lines_per_feature})")
 
                 # Suggest decomposition
                 decomposition_info = {
@@ -504,20 +693,23 @@ class PrimeContractorWorkflow:
         risk_score = 0
         
         for target_file in feature.target_files:
-            target_path = Path(target_file)
-            
             # Check if this file was modified by a previous feature in this session
             if target_file in self.files_modified_this_session:
                 prev_features = self.files_modified_this_session[target_file]
                 warnings.append(
-                    f"File {target_path.name} was already modified by: {', '.join(prev_features)}"
+                    f"File {os.path.basename(target_file)} was already modified by: {', '.join(prev_features)}"
                 )
                 risk_score += 30
             
             # Check if target file exists and has recent changes
-            if target_path.exists():
-                # Analyze content to understand what might be overwritten
-                analysis = analyze_file_content(target_path)
+            try:
+                st = os.stat(target_file)
+            except OSError:
+                st = None
+            if st is not None:
+                # Analyze content to understand what might be overwritten;
+                # features sharing a target reuse the analysis until it changes
+                analysis = _analyze_file_cached(target_file, st.st_mtime_ns, st.st_size)
                 if "error" not in analysis:
                     if analysis.get("classes"):
                         warnings.append(
@@ -540,62 +732,86 @@ class PrimeContractorWorkflow:
         
         return risk_level, warnings
     
-    def develop_feature(self, feature: FeatureSpec) -> bool:
+    def develop_feature(self, feature: FeatureSpec, verbose: bool = True) -> bool:
         """
         Develop a feature using the Lead Contractor workflow.
 
         This calls the Lead Contractor (Claude Sonnet + GPT-4o-mini drafter)
         to generate code for the feature.
 
+        Args:
+            feature: Feature to develop
+            verbose: Print full progress; when False (concurrent development)
+                only one-line outcomes prefixed with the feature name are printed
+
         Returns:
             True if code generation succeeded, False otherwise
         """
-        print(f"\n{'='*70}")
-        print(f"DEVELOPING FEATURE: {feature.name}")
-        print(f"{'='*70}")
+        prefix = f"  [{feature.name}]"
+
+        if verbose:
+            print(f"\n{'='*70}")
+            print(f"DEVELOPING FEATURE: {feature.name}")
+            print(f"{'='*70}")
 
         # PRE-FLIGHT VALIDATION: Estimate size before generation
         # This is the proactive truncation prevention pattern
-        should_proceed, decomposition_info = self.pre_flight_validation(feature)
+        should_proceed, decomposition_info = self.pre_flight_validation(feature, verbose=verbose)
 
         if not should_proceed:
-            print(f"\n  PRE-FLIGHT FAILED: Feature may be too large")
-            print(f"    {decomposition_info.get('reason', 'Size exceeds safe limits')}")
-            print(f"    Suggested: {decomposition_info.get('suggested_action', 'Split into smaller features')}")
+            if verbose:
+                print(f"\n  PRE-FLIGHT FAILED: Feature may be too large")
+                print(f"    {decomposition_info.get('reason', 'Size exceeds safe limits')}")
+                print(f"    Suggested: {decomposition_info.get('suggested_action', 'Split into smaller features')}")
+            else:
+                print(f"{prefix} PRE-FLIGHT FAILED: {decomposition_info.get('reason', 'Size exceeds safe limits')}")
             self.queue.fail_feature(feature.id, f"Pre-flight failed: {decomposition_info.get('reason')}")
             return False
 
         # Mark as developing
         self.queue.start_feature(feature.id)
 
-        # Create a Lead Contractor Feature from the FeatureSpec
-        lc_feature = Feature(
-            task=feature.description,
-            name=feature.name.replace(" ", "_"),
-            is_typescript=any(f.endswith('.ts') or f.endswith('.tsx') for f in feature.target_files),
-            output_subdir=f"prime_contractor/{feature.id}",
-        )
-
         if self.dry_run:
-            print(f"  [DRY RUN] Would generate code for: {feature.name}")
-            print(f"  Task description: {feature.description[:100]}...")
-            print(f"  Target files: {feature.target_files}")
+            if verbose:
+                print(f"  [DRY RUN] Would generate code for: {feature.name}")
+                print(f"  Task description: {feature.description[:100]}...")
+                print(f"  Target files: {feature.target_files}")
             # In dry run, simulate generated files based on target files
             simulated_files = [f"generated/prime_contractor/{feature.id}/{Path(t).name}" for t in feature.target_files] if feature.target_files else [f"generated/prime_contractor/{feature.id}/code.py"]
             feature.generated_files = simulated_files
             feature.status = FeatureStatus.GENERATED
             self.queue.save_state()
-            print(f"  [DRY RUN] Would produce: {simulated_files}")
+            if verbose:
+                print(f"  [DRY RUN] Would produce: {simulated_files}")
+            else:
+                print(f"{prefix} [DRY RUN] Would produce: {simulated_files}")
             return True
 
-        print(f"  Running Lead Contractor workflow...")
-        print(f"  Lead Agent: Claude Sonnet (spec creation, review)")
-        print(f"  Drafter Agent: GPT-4o-mini (implementation)")
-        print()
+        from scripts.lead_contractor.runner import (
+            Feature,
+            run_workflow as run_lead_contractor,
+            save_result,
+        )
+
+        # Create a Lead Contractor Feature from the FeatureSpec
+        lc_feature = Feature(
+            task=feature.description,
+            name=feature.name.replace(" ", "_"),
+            is_typescript=any(f.endswith('.ts') or f.endswith('.tsx') for f in feature.target_files),
+            output_subdir=f"prime_contractor/{feature.id}",
+        )
+
+        if verbose:
+            print(f"  Running Lead Contractor workflow...")
+            print(f"  Lead Agent: Claude Sonnet (spec creation, review)")
+            print(f"  Drafter Agent: GPT-4o-mini (implementation)")
+            print()
+        else:
+            print(f"{prefix} Running Lead Contractor workflow...")
 
         try:
             # Run the Lead Contractor workflow
-            result = run_lead_contractor(lc_feature, verbose=True)
+            result = run_lead_contractor(lc_feature, verbose=verbose)
 
             if result.success:
                 # Save the result
@@ -607,9 +823,11 @@ class PrimeContractorWorkflow:
                 self.queue.save_state()
 
                 # Track cumulative costs (BLC-009)
-                self.total_cost_usd += result.total_cost
-                self.total_input_tokens += result.input_tokens
-                self.total_output_tokens += result.output_tokens
+                with self._cost_lock:
+                    self.total_cost_usd += result.total_cost
+                    self.total_input_tokens += result.input_tokens
+                    self.total_output_tokens += result.output_tokens
+                    cumulative_cost = self.total_cost_usd
 
                 # Emit cost tracking span (BLC-009)
                 with self.tracer.start_as_current_span("prime_contractor.feature_cost") as span:
@@ -617,29 +835,87 @@ class PrimeContractorWorkflow:
                     span.set_attribute("gen_ai.usage.output_tokens", result.output_tokens)
                     span.set_attribute("gen_ai.request.model", result.model)
                     span.set_attribute("contextcore.cost.usd", result.total_cost)
-                    span.set_attribute("contextcore.cost.cumulative_usd", self.total_cost_usd)
+                    span.set_attribute("contextcore.cost.cumulative_usd", cumulative_cost)
                     span.set_attribute("contextcore.feature.name", feature.name)
                     span.set_attribute("contextcore.iterations", result.iterations)
 
-                print(f"\n✓ Code generated successfully!")
-                print(f"  Cost: ${result.total_cost:.4f} (cumulative: ${self.total_cost_usd:.4f})")
-                print(f"  Tokens: {result.input_tokens} in / {result.output_tokens} out")
-                print(f"  Iterations: {result.iterations}")
-                print(f"  Output: {code_file}")
+                if verbose:
+                    print(f"\n✓ Code generated successfully!")
+                    print(f"  Cost: ${result.total_cost:.4f} (cumulative: ${cumulative_cost:.4f})")
+                    print(f"  Tokens: {result.input_tokens} in / {result.output_tokens} out")
+                    print(f"  Iterations: {result.iterations}")
+                    print(f"  Output: {code_file}")
+                else:
+                    print(f"{prefix} ✓ Code generated: ${result.total_cost:.4f}, "
+                          f"{result.iterations} iteration(s) -> {code_file}")
 
                 return True
             else:
                 error_msg = result.error or "Lead Contractor workflow failed"
-                print(f"\n✗ Code generation failed: {error_msg}")
+                print(f"\n✗ Code generation failed: {error_msg}" if verbose
+                      else f"{prefix} ✗ Code generation failed: {error_msg}")
                 self.queue.fail_feature(feature.id, error_msg)
                 return False
 
         except Exception as e:
             error_msg = f"Exception during code generation: {e}"
-            print(f"\n✗ {error_msg}")
+            print(f"\n✗ {error_msg}" if verbose else f"{prefix} ✗ {error_msg}")
             self.queue.fail_feature(feature.id, error_msg)
             return False
 
+    def select_development_batch(self, first: FeatureSpec, limit: int) -> List[FeatureSpec]:
+        """
+        Pick ready PENDING features that can be developed alongside ``first``.
+
+        Features are taken in queue order and only if their target files are
+        disjoint from every feature already in the batch, so the batch can
+        later be integrated one at a time without the features competing
+        for the same file.
+
+        Args:
+            first: The feature the workflow would develop next
+            limit: Maximum batch size
+
+        Returns:
+            Features to develop concurrently, starting with ``first``
+        """
+        batch = [first]
+        claimed = set(first.target_files)
+
+        for feature in self.queue.iter_ready_features():
+            if len(batch) >= limit:
+                break
+            if feature is first or feature.status != FeatureStatus.PENDING:
+                continue
+            if claimed.isdisjoint(feature.target_files):
+                batch.append(feature)
+                claimed.update(feature.target_files)
+
+        return batch
+
+    def develop_features_concurrently(self, features: List[FeatureSpec]) -> Dict[str, bool]:
+        """
+        Run develop_feature for several features at once.
+
+        Code generation is dominated by Lead Contractor API round-trips, so
+        features with disjoint targets are generated on a thread pool of
+        ``parallel_develop`` workers. Integration stays sequential. Workers
+        run quietly, printing one line per outcome prefixed with the feature
+        name, so their output stays readable when interleaved.
+
+        Returns:
+            Dict mapping feature id to whether code generation succeeded
+        """
+        print(f"\nDeveloping {len(features)} feature(s) concurrently: "
+              f"{', '.join(f.name for f in features)}")
+
+        with ThreadPoolExecutor(max_workers=self.parallel_develop) as executor:
+            results = list(executor.map(
+                functools.partial(self.develop_feature, verbose=False), features
+            ))
+
+        return {feature.id: ok for feature, ok in zip(features, results, strict=True)}
+
     def process_feature(self, feature: FeatureSpec) -> bool:
         """
         Process a feature through the full lifecycle: develop then integrate.
@@ -732,6 +1008,16 @@ class PrimeContractorWorkflow:
         
         # Get the generated files to integrate
         integrated_files = []
+
+        # Take a fresh git status for this feature: the user may have edited
+        # files while earlier features were being generated
+        self.invalidate_dirty_cache()
+
+        # Check declared targets for uncommitted changes up front; inferred
+        # targets fall back to protect_dirty_target in the loop
+        safe_targets: Dict[Path, bool] = {}
+        if not self.dry_run and not self.allow_dirty:
+            safe_targets = self.protect_dirty_targets([Path(t) for t in feature.target_files])
         
         for i, source_file in enumerate(feature.generated_files):
             source_path = Path(source_file)
@@ -790,7 +1076,12 @@ class PrimeContractorWorkflow:
 
             # Target file protection: refuse to overwrite files with uncommitted changes
             if target_path.exists() and not self.allow_dirty:
-                if not self.protect_dirty_target(target_path):
+                safe = safe_targets.get(target_path)
+                if safe is None:
+                    safe = self.protect_dirty_target(target_path)
+                elif not safe:
+                    self._warn_dirty_target(target_path)
+                if not safe:
                     print(f"  Skipping {target_path.name} to protect uncommitted changes")
                     continue
 
@@ -826,12 +1117,18 @@ class PrimeContractorWorkflow:
                         print(f"  ✗ Merge failed for: {target_path.name}")
                 else:
                     # Standard integration (overwrite)
-                    if integrate_file(source_path, target_path, dry_run=False):
+                    if integrate_file(source_path, target_path, dry_run=False,
+                                      content=self._validated_sources.get(source_file)):
                         integrated_files.append(target_path)
             else:
                 # New file - just integrate
-                if integrate_file(source_path, target_path, dry_run=False):
+                if integrate_file(source_path, target_path, dry_run=False,
+                                  content=self._validated_sources.get(source_file)):
                     integrated_files.append(target_path)
+
+        # Files written above are now dirty for the features that follow
+        if integrated_files and not self.dry_run:
+            self.invalidate_dirty_cache()
         
         if not integrated_files:
             error_msg = "No files were integrated"
@@ -850,10 +1147,7 @@ class PrimeContractorWorkflow:
         
         # Track which files were modified by this feature
         for file_path in integrated_files:
-            file_str = str(file_path)
-            if file_str not in self.files_modified_this_session:
-                self.files_modified_this_session[file_str] = []
-            self.files_modified_this_session[file_str].append(feature.name)
+            self.files_modified_this_session.setdefault(str(file_path), []).append(feature.name)
         
         # Run checkpoints
         if not self.dry_run:
@@ -938,6 +1232,8 @@ class PrimeContractorWorkflow:
             text=True
         )
         
+        self.invalidate_dirty_cache()
+
         if result.returncode == 0:
             print(f"  ✓ Committed: {feature.name}")
         else:
@@ -1058,6 +1354,28 @@ class PrimeContractorWorkflow:
                 print("\nNo more features to process")
                 break
             
+            # Generate code for a batch of independent features up front;
+            # the loop then integrates them one at a time as GENERATED
+            if self.parallel_develop > 1 and feature.status == FeatureStatus.PENDING:
+                limit = self.parallel_develop
+                if max_features:
+                    awaiting_integration = sum(
+                        1 for f in self.queue.iter_ready_features()
+                        if f.status == FeatureStatus.GENERATED
+                    )
+                    limit = min(limit, max_features - features_processed - awaiting_integration)
+                batch = self.select_development_batch(feature, limit)
+                if len(batch) > 1:
+                    developed = self.develop_features_concurrently(batch)
+                    failed = [f for f in batch if not developed[f.id]]
+                    features_processed += len(failed)
+                    features_failed += len(failed)
+                    if failed and stop_on_failure:
+                        print(f"\n❌ STOPPING: Feature '{failed[0].name}' failed")
+                        print("   Fix the issue and re-run to continue")
+                        break
+                    continue
+
             features_processed += 1
 
             # Process the feature (develop if needed, then integrate)
@@ -18,6 +18,8 @@ Example:
 
 from __future__ import annotations
 
+from functools import cached_property
+
 from contextcore.api.insights import InsightsAPI
 from contextcore.api.handoffs import HandoffsAPI
 from contextcore.api.skills import SkillsAPI
@@ -69,24 +71,36 @@ class ContextCoreAPI:
     ) -> None:
         self.project_id = project_id
         self.agent_id = agent_id
+        self._tempo_url = tempo_url
+        self._provider = provider
+        self._model = model
+
+    # Subsystems are built on first access: most callers only use one of
+    # them, and each constructs its own emitter/querier/backends.
 
+    @cached_property
+    def insights(self) -> InsightsAPI:
         insights_kwargs: dict = {}
-        if tempo_url:
-            insights_kwargs["tempo_url"] = tempo_url
-        self.insights = InsightsAPI(
-            project_id=project_id, agent_id=agent_id, **insights_kwargs,
+        if self._tempo_url:
+            insights_kwargs["tempo_url"] = self._tempo_url
+        return InsightsAPI(
+            project_id=self.project_id, agent_id=self.agent_id, **insights_kwargs,
         )
 
+    @cached_property
+    def handoffs(self) -> HandoffsAPI:
         handoffs_kwargs: dict = {}
-        if provider:
-            handoffs_kwargs["provider"] = provider
-        if model:
-            handoffs_kwargs["model"] = model
-        self.handoffs = HandoffsAPI(
-            project_id=project_id, agent_id=agent_id, **handoffs_kwargs,
+        if self._provider:
+            handoffs_kwargs["provider"] = self._provider
+        if self._model:
+            handoffs_kwargs["model"] = self._model
+        return HandoffsAPI(
+            project_id=self.project_id, agent_id=self.agent_id, **handoffs_kwargs,
         )
 
+    @cached_property
+    def skills(self) -> SkillsAPI:
         skills_kwargs: dict = {}
-        if tempo_url:
-            skills_kwargs["tempo_url"] = tempo_url
-        self.skills = SkillsAPI(agent_id=agent_id, **skills_kwargs)
+        if self._tempo_url:
+            skills_kwargs["tempo_url"] = self._tempo_url
+        return SkillsAPI(agent_id=self.agent_id, **skills_kwargs)
@@ -14,13 +14,6 @@ from typing import Any, Dict, List, Optional
 # Import required classes from contextcore.graph.schema
 from contextcore.graph.schema import Graph, Node, Edge, NodeType, EdgeType
 
-# Kubernetes imports for the GraphWatcher stub
-try:
-    from kubernetes import client, config, watch
-except ImportError:
-    # Graceful fallback if kubernetes client is not available
-    client = config = watch = None
-
 __all__ = ['GraphBuilder', 'GraphWatcher']
 
 
@@ -186,15 +179,18 @@ class GraphBuilder:
 
     def _hash_url(self, url: str) -> str:
         """
-        Generate MD5 hash of URL, truncated to first 12 characters.
-        
+        Generate a 12-character hex digest of URL.
+
+        Uses BLAKE2b with a 6-byte digest: faster than MD5 on OpenSSL builds,
+        not blocked under FIPS, and no throwaway digest bytes to truncate.
+
         Args:
             url: URL string to hash
-            
+
         Returns:
-            str: First 12 characters of MD5 hash
+            str: 12-character hex digest
         """
-        return hashlib.md5(url.encode()).hexdigest()[:12]
+        return hashlib.blake2b(url.encode(), digest_size=6).hexdigest()
 
     def _risk_weight(self, priority: Optional[str]) -> float:
         """
@@ -259,9 +255,13 @@ class GraphWatcher:
         Placeholder implementation - in production this would use
         kubernetes.watch to monitor CRD changes and trigger graph updates.
         """
-        if client is None:
-            raise RuntimeError("Kubernetes client not available")
-        
+        # Imported here so building a graph never pays for the kubernetes
+        # client import; only watching needs it.
+        try:
+            from kubernetes import client, watch  # noqa: F401
+        except ImportError:
+            raise RuntimeError("Kubernetes client not available") from None
+
         self._watching = True
         # TODO: Implement actual Kubernetes watching logic
         # Example:
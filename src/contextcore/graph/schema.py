@@ -45,7 +45,7 @@ class EdgeType(Enum):
     CALLS = "calls"                 # Resource -> Resource (from traces)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Node:
     """Immutable representation of a node in the knowledge graph.
 
@@ -80,7 +80,7 @@ class Node:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Edge:
     """Immutable representation of an edge in the knowledge graph.
 
@@ -112,12 +112,12 @@ class Edge:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Graph:
     """Container for nodes and edges forming a knowledge graph.
 
     Provides efficient operations for building and querying graph structures
-    with O(1) node lookup and O(n) edge traversal operations.
+    with O(1) node lookup and O(degree) edge traversal operations.
 
     Attributes:
         nodes: Dictionary mapping node IDs to Node instances for O(1) lookup
@@ -125,6 +125,22 @@ class Graph:
     """
     nodes: Dict[str, Node] = field(default_factory=dict)
     edges: List[Edge] = field(default_factory=list)
+    # Adjacency indexes maintained by add_edge, so per-node edge lookups do
+    # not scan the whole edge list.
+    _out_edges: Dict[str, List[Edge]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _in_edges: Dict[str, List[Edge]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        for edge in self.edges:
+            self._index_edge(edge)
+
+    def _index_edge(self, edge: Edge) -> None:
+        self._out_edges.setdefault(edge.source_id, []).append(edge)
+        self._in_edges.setdefault(edge.target_id, []).append(edge)
 
     def add_node(self, node: Node) -> None:
         """Add or update a node in the graph.
@@ -151,8 +167,9 @@ class Graph:
             raise ValueError(f"Source node '{edge.source_id}' does not exist in graph")
         if edge.target_id not in self.nodes:
             raise ValueError(f"Target node '{edge.target_id}' does not exist in graph")
-        
+
         self.edges.append(edge)
+        self._index_edge(edge)
 
     def get_node(self, node_id: str) -> Optional[Node]:
         """Retrieve a node by its ID.
@@ -174,7 +191,7 @@ class Graph:
         Returns:
             List of edges where the node is the source
         """
-        return [edge for edge in self.edges if edge.source_id == node_id]
+        return list(self._out_edges.get(node_id, ()))
 
     def get_edges_to(self, node_id: str) -> List[Edge]:
         """Get all incoming edges to a specified node.
@@ -185,7 +202,7 @@ class Graph:
         Returns:
             List of edges where the node is the target
         """
-        return [edge for edge in self.edges if edge.target_id == node_id]
+        return list(self._in_edges.get(node_id, ()))
 
     def to_dict(self) -> Dict[str, List[Dict[str, Any]]]:
         """Convert the entire graph to a JSON-serializable dictionary.
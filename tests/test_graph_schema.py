@@ -0,0 +1,95 @@
+"""
+Tests for the knowledge graph schema.
+"""
+
+import copy
+import pickle
+
+import pytest
+
+from contextcore.graph.schema import Edge, EdgeType, Graph, Node, NodeType
+
+
+NODE_IDS = ["project:a", "project:b", "team:x", "resource:r"]
+
+
+def make_nodes():
+    return {
+        node_id: Node(id=node_id, type=NodeType.PROJECT, name=node_id)
+        for node_id in NODE_IDS
+    }
+
+
+def make_edges():
+    return [
+        Edge(source_id="project:a", target_id="project:b", type=EdgeType.DEPENDS_ON),
+        Edge(source_id="project:a", target_id="team:x", type=EdgeType.OWNED_BY),
+        Edge(source_id="project:b", target_id="team:x", type=EdgeType.OWNED_BY),
+        Edge(source_id="project:a", target_id="resource:r", type=EdgeType.MANAGES),
+        Edge(source_id="resource:r", target_id="resource:r", type=EdgeType.CALLS),
+    ]
+
+
+def assert_index_matches_scan(graph: Graph):
+    """get_edges_from/get_edges_to agree with a linear scan of graph.edges."""
+    for node_id in NODE_IDS + ["missing"]:
+        assert graph.get_edges_from(node_id) == [e for e in graph.edges if e.source_id == node_id]
+        assert graph.get_edges_to(node_id) == [e for e in graph.edges if e.target_id == node_id]
+
+
+class TestGraphEdgeIndex:
+    """The adjacency index must stay consistent with the edge list."""
+
+    def test_index_built_from_constructor_edges(self):
+        graph = Graph(nodes=make_nodes(), edges=make_edges())
+        assert_index_matches_scan(graph)
+
+    def test_index_updated_by_add_edge(self):
+        graph = Graph()
+        for node in make_nodes().values():
+            graph.add_node(node)
+        for edge in make_edges():
+            graph.add_edge(edge)
+
+        assert len(graph.edges) == 5
+        assert_index_matches_scan(graph)
+
+    def test_add_edge_after_constructor_edges(self):
+        edges = make_edges()
+        graph = Graph(nodes=make_nodes(), edges=edges[:2])
+        for edge in edges[2:]:
+            graph.add_edge(edge)
+
+        assert_index_matches_scan(graph)
+
+    def test_add_edge_rejects_unknown_nodes(self):
+        graph = Graph(nodes=make_nodes())
+        with pytest.raises(ValueError):
+            graph.add_edge(Edge(source_id="project:a", target_id="missing", type=EdgeType.CALLS))
+
+        assert graph.edges == []
+        assert graph.get_edges_from("project:a") == []
+
+    def test_returned_lists_do_not_alias_index(self):
+        graph = Graph(nodes=make_nodes(), edges=make_edges())
+        graph.get_edges_from("project:a").clear()
+
+        assert_index_matches_scan(graph)
+
+    @pytest.mark.parametrize(
+        "clone",
+        [copy.deepcopy, lambda g: pickle.loads(pickle.dumps(g))],
+        ids=["deepcopy", "pickle"],
+    )
+    def test_index_survives_copy(self, clone):
+        graph = Graph(nodes=make_nodes(), edges=make_edges())
+
+        cloned = clone(graph)
+        assert cloned == graph
+        assert_index_matches_scan(cloned)
+
+        # The clone's index is its own and keeps tracking new edges
+        cloned.add_edge(Edge(source_id="team:x", target_id="project:a", type=EdgeType.CALLS))
+        assert_index_matches_scan(cloned)
+        assert_index_matches_scan(graph)
+        assert len(graph.get_edges_to("project:a")) == 0
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Tests for the Prime Contractor workflow.
+
+Tests cover:
+- Dirty-target protection across consecutive integrations
+- Concurrent development batches (selection, max_features, stop_on_failure)
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add project root to path for imports
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import scripts.lead_contractor.integrate_backlog as integrate_backlog
+from scripts.prime_contractor.feature_queue import FeatureQueue, FeatureStatus
+from scripts.prime_contractor.workflow import PrimeContractorWorkflow
+
+
+def git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.email=test@example.com", "-c", "user.name=Test", *args],
+        cwd=repo, check=True, capture_output=True,
+    )
+
+
+def make_workflow(root: Path, **kwargs) -> PrimeContractorWorkflow:
+    workflow = PrimeContractorWorkflow(project_root=root, **kwargs)
+    workflow.queue = FeatureQueue(state_file=root / ".prime_contractor_state.json")
+    workflow._insight_emitter = MagicMock()
+    workflow.checkpoint = MagicMock()
+    workflow.checkpoint.run_all_checkpoints.return_value = []
+    workflow.checkpoint.summarize_results.return_value = True
+    return workflow
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """A git repo with two committed target files."""
+    git(tmp_path, "init", "-q")
+    (tmp_path / "other.py").write_text("x = 1\n")
+    (tmp_path / "target.py").write_text("y = 1\n")
+    git(tmp_path, "add", "other.py", "target.py")
+    git(tmp_path, "commit", "-q", "-m", "initial")
+    # integrate_file reports paths relative to the project root
+    monkeypatch.setattr(integrate_backlog, "PROJECT_ROOT", tmp_path)
+    return tmp_path
+
+
+def add_generated_feature(workflow, root: Path, feature_id: str, target: str, content: str):
+    generated = root / "generated" / f"{feature_id}.py"
+    generated.parent.mkdir(exist_ok=True)
+    generated.write_text(content)
+    spec = workflow.queue.add_feature(feature_id, feature_id, target_files=[str(root / target)])
+    spec.generated_files = [str(generated)]
+    spec.status = FeatureStatus.GENERATED
+    return spec, generated
+
+
+class TestDirtyTargetProtection:
+    """Uncommitted changes must never be overwritten by integration."""
+
+    def test_refuses_file_dirtied_between_integrations(self, repo):
+        workflow = make_workflow(repo)
+
+        # First feature integrates nothing: its only target is already dirty
+        (repo / "other.py").write_text("x = 'user edit'\n")
+        first, _ = add_generated_feature(workflow, repo, "first", "other.py", "x = 2\n")
+        assert workflow.integrate_feature(first) is False
+        assert (repo / "other.py").read_text() == "x = 'user edit'\n"
+
+        # The user edits the next feature's target while it is being generated
+        (repo / "target.py").write_text("y = 'user edit'\n")
+        second, generated = add_generated_feature(workflow, repo, "second", "target.py", "y = 2\n")
+        # Keep check_if_integrated from treating the edited target as integrated
+        newer = (repo / "target.py").stat().st_mtime + 10
+        os.utime(generated, (newer, newer))
+
+        assert workflow.integrate_feature(second) is False
+        assert (repo / "target.py").read_text() == "y = 'user edit'\n"
+
+    def test_integrates_clean_target(self, repo):
+        workflow = make_workflow(repo)
+        spec, generated = add_generated_feature(workflow, repo, "clean", "target.py", "y = 2\n")
+        newer = (repo / "target.py").stat().st_mtime + 10
+        os.utime(generated, (newer, newer))
+
+        assert workflow.integrate_feature(spec) is True
+        assert (repo / "target.py").read_text() == "y = 2"
+
+
+class TestConcurrentDevelopment:
+    """parallel_develop batches code generation, integration stays serial."""
+
+    @pytest.fixture
+    def workflow(self, tmp_path):
+        workflow = make_workflow(tmp_path, parallel_develop=4, allow_dirty=True)
+        workflow.developed = []
+        workflow.integrated = []
+        workflow.failing = set()
+
+        def fake_develop(feature, verbose=True):
+            workflow.developed.append(feature.id)
+            if feature.id in workflow.failing:
+                workflow.queue.fail_feature(feature.id, "generation failed")
+                return False
+            workflow.queue.mark_generated(feature.id, [f"generated/{feature.id}.py"])
+            return True
+
+        def fake_integrate(feature):
+            workflow.integrated.append(feature.id)
+            workflow.queue.complete_feature(feature.id)
+            return True
+
+        workflow.develop_feature = fake_develop
+        workflow.integrate_feature = fake_integrate
+        return workflow
+
+    def add_pending(self, workflow, feature_id, *targets):
+        return workflow.queue.add_feature(feature_id, feature_id, target_files=list(targets))
+
+    def test_batch_skips_overlapping_targets(self, workflow):
+        first = self.add_pending(workflow, "f0", "a.py")
+        self.add_pending(workflow, "f1", "b.py")
+        self.add_pending(workflow, "f2", "a.py")
+        self.add_pending(workflow, "f3", "c.py", "b.py")
+        self.add_pending(workflow, "f4", "d.py")
+
+        batch = workflow.select_development_batch(first, limit=4)
+
+        assert [f.id for f in batch] == ["f0", "f1", "f4"]
+
+    def test_batch_respects_limit(self, workflow):
+        first = self.add_pending(workflow, "f0", "a.py")
+        self.add_pending(workflow, "f1", "b.py")
+        self.add_pending(workflow, "f2", "c.py")
+
+        batch = workflow.select_development_batch(first, limit=2)
+
+        assert [f.id for f in batch] == ["f0", "f1"]
+
+    def test_run_develops_batch_then_integrates_in_order(self, workflow):
+        for i, target in enumerate(["a.py", "b.py", "a.py"]):
+            self.add_pending(workflow, f"f{i}", target)
+
+        result = workflow.run()
+
+        # f2 shares a target with f0, so it is developed on its own later
+        assert workflow.developed[:2] == ["f0", "f1"]
+        assert workflow.developed[2:] == ["f2"]
+        assert workflow.integrated == ["f0", "f1", "f2"]
+        assert (result["processed"], result["succeeded"], result["failed"]) == (3, 3, 0)
+
+    def test_max_features_limits_batch(self, workflow):
+        workflow.queue.add_feature("g0", "g0", target_files=["g.py"])
+        workflow.queue.mark_generated("g0", ["generated/g0.py"])
+        for i, target in enumerate(["a.py", "b.py", "c.py"], 1):
+            self.add_pending(workflow, f"p{i}", target)
+
+        result = workflow.run(max_features=3)
+
+        # g0 uses one slot, so only two features may be developed
+        assert sorted(workflow.developed) == ["p1", "p2"]
+        assert workflow.integrated == ["g0", "p1", "p2"]
+        assert workflow.queue.features["p3"].status == FeatureStatus.PENDING
+        assert result["processed"] == 3
+
+    def test_max_features_counts_features_awaiting_integration(self, workflow):
+        self.add_pending(workflow, "p0", "a.py")
+        workflow.queue.add_feature("g1", "g1", target_files=["g.py"])
+        workflow.queue.mark_generated("g1", ["generated/g1.py"])
+        self.add_pending(workflow, "p2", "b.py")
+        self.add_pending(workflow, "p3", "c.py")
+
+        result = workflow.run(max_features=2)
+
+        # g1 is already generated and takes the second slot
+        assert workflow.developed == ["p0"]
+        assert workflow.integrated == ["p0", "g1"]
+        assert result["processed"] == 2
+
+    def test_stop_on_failure_in_batch(self, workflow):
+        for i, target in enumerate(["a.py", "b.py", "c.py"]):
+            self.add_pending(workflow, f"f{i}", target)
+        workflow.failing = {"f1"}
+
+        result = workflow.run(stop_on_failure=True)
+
+        assert sorted(workflow.developed) == ["f0", "f1", "f2"]
+        assert workflow.integrated == []
+        assert (result["processed"], result["succeeded"], result["failed"]) == (1, 0, 1)
+
+    def test_continue_after_failure_in_batch(self, workflow):
+        for i, target in enumerate(["a.py", "b.py", "c.py"]):
+            self.add_pending(workflow, f"f{i}", target)
+        workflow.failing = {"f1"}
+
+        result = workflow.run(stop_on_failure=False)
+
+        assert workflow.integrated == ["f0", "f2"]
+        assert workflow.queue.features["f1"].status == FeatureStatus.FAILED
+        assert (result["processed"], result["succeeded"], result["failed"]) == (3, 2, 1)
+
+    def test_workers_develop_quietly(self, workflow):
+        calls = []
+        workflow.develop_feature = lambda feature, verbose=True: calls.append(verbose) or True
+        features = [self.add_pending(workflow, f"f{i}", f"{i}.py") for i in range(2)]
+
+        workflow.develop_features_concurrently(features)
+
+        assert calls == [False, False]